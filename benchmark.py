@@ -0,0 +1,476 @@
+"""Benchmark runner: time every day's part one and part two"""
+
+import argparse
+import contextlib
+import csv
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from statistics import mean
+from types import ModuleType
+from typing import Any, Callable
+
+import generators
+import parse_cache
+import profiling
+import progress
+
+DAYS = range(1, 26)
+
+PartRunner = Callable[[ModuleType, str], Any]
+
+
+def on_lines(func_name: str, *args, **kwargs) -> PartRunner:
+    """Call `func_name` with the puzzle split into lines (what most days expect)"""
+
+    def run(module: ModuleType, text: str) -> Any:
+        return getattr(module, func_name)(text.splitlines(), *args, **kwargs)
+
+    return run
+
+
+def on_text(func_name: str, *args, strip: bool = False, **kwargs) -> PartRunner:
+    """Call `func_name` with the raw puzzle text"""
+
+    def run(module: ModuleType, text: str) -> Any:
+        return getattr(module, func_name)(
+            text.strip() if strip else text, *args, **kwargs
+        )
+
+    return run
+
+
+# Every day grew its own calling convention, so this is the one place that
+# knows how to turn the contents of dayXX.txt into an answer for each part.
+# Anything besides part_one and part_two is an alternative implementation that
+# only runs when asked for by name with --part.
+PARTS: dict[int, dict[str, PartRunner]] = {
+    1: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    2: {"part_one": on_lines("play_game"), "part_two": on_lines("play_part_two")},
+    3: {
+        "part_one": on_lines("part_one"),
+        "part_two": on_lines("part_two"),
+        "part_one_numpy": on_text("part_one_numpy"),
+        "part_two_numpy": on_text("part_two_numpy"),
+    },
+    4: {
+        "part_one": lambda day, text: day.part_one(day.parse_input(text.splitlines())),
+        "part_two": lambda day, text: day.part_two(day.parse_input(text.splitlines())),
+        "part_one_numpy": on_text("part_one_numpy"),
+        "part_two_numpy": on_text("part_two_numpy"),
+    },
+    5: {
+        # both parts mutate the crates, so parse fresh every time
+        "part_one": lambda day, text: day.part_one(*day.parse_input(text.splitlines())),
+        "part_two": lambda day, text: day.part_two(*day.parse_input(text.splitlines())),
+        "part_one_backwards": lambda day, text: day.part_one_backwards(
+            *day.parse_input(text.splitlines())
+        ),
+        "part_two_backwards": lambda day, text: day.part_two_backwards(
+            *day.parse_input(text.splitlines())
+        ),
+    },
+    6: {
+        "part_one": on_text("part_one", strip=True),
+        "part_two": on_text("part_two", strip=True),
+    },
+    7: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    8: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    9: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    10: {"part_one": on_lines("part_one"), "part_two": on_lines("part_one", True)},
+    11: {"part_one": on_lines("part_one"), "part_two": on_lines("part_one", 10000)},
+    12: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    13: {"part_one": on_text("part_one"), "part_two": on_text("part_two")},
+    14: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    15: {
+        "part_one": on_lines("part_one", 2_000_000),
+        "part_two": on_lines("part_two", 4_000_000, 4_000_000),
+    },
+    16: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    17: {
+        "part_one": on_text("part_one", strip=True),
+        "part_two": on_text("part_one", 1000000000000, strip=True),
+    },
+    18: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    19: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    20: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    21: {"part_one": on_lines("part_one"), "part_two": on_lines("part_two")},
+    22: {"part_one": on_text("part_one"), "part_two": on_text("part_two")},
+    23: {
+        "part_one": on_lines("part_one"),
+        "part_two": on_lines("part_one", rounds=1000000),
+    },
+    24: {
+        "part_one": on_lines("part_one"),
+        # part two starts from wherever part one finished, so it has to
+        # pay for part one as well
+        "part_two": lambda day, text: day.part_two(
+            text.splitlines(), day.part_one(text.splitlines())
+        ),
+    },
+    25: {"part_one": on_lines("part_one")},
+}
+
+
+@dataclass
+class Timing:
+    day: int
+    part: str
+    runs: int
+    wall_min: float
+    wall_mean: float
+    cpu_mean: float
+    peak_memory: int | None
+    answer: str
+    # for runs on generated inputs, the size they were generated at
+    size: int | None = None
+
+
+def input_path(day: int, input_dir: Path) -> Path:
+    return input_dir / f"day{day:02}.txt"
+
+
+@contextlib.contextmanager
+def silenced(verbose: bool):
+    """Throw away whatever the solutions print unless we asked to see it"""
+    if verbose:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def time_part(
+    day: int,
+    part: str,
+    text: str,
+    runs: int = 1,
+    memory: bool = True,
+    verbose: bool = False,
+    warm: bool = False,
+    profile: list[str] | None = None,
+    profile_dir: Path = Path("profiles"),
+) -> Timing:
+    """Run one part `runs` times and collect its timings
+
+    Peak memory comes from one extra run under tracemalloc so that its
+    overhead doesn't leak into the wall and CPU numbers. Unless `warm` is set,
+    the in-memory parse cache is emptied before every run so each one pays
+    for its own parsing. Likewise, `profile` modes (see `profiling`) get a run
+    of their own, reported under `profile_dir`.
+    """
+    module = importlib.import_module(f"day{day:02}")
+    runner = PARTS[day][part]
+    progress.configure(enabled=verbose)
+    wall_times = []
+    cpu_times = []
+    answer = None
+    with silenced(verbose):
+        for _ in range(runs):
+            if not warm:
+                parse_cache.clear()
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            answer = runner(module, text)
+            cpu_times.append(time.process_time() - cpu_start)
+            wall_times.append(time.perf_counter() - wall_start)
+        peak_memory = None
+        if memory:
+            if not warm:
+                parse_cache.clear()
+            tracemalloc.start()
+            try:
+                runner(module, text)
+                _, peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        if profile:
+            if not warm:
+                parse_cache.clear()
+            with profiling.profiled(profile, profile_dir / f"day{day:02}_{part}"):
+                runner(module, text)
+    return Timing(
+        day=day,
+        part=part,
+        runs=runs,
+        wall_min=min(wall_times),
+        wall_mean=mean(wall_times),
+        cpu_mean=mean(cpu_times),
+        peak_memory=peak_memory,
+        answer=str(answer),
+    )
+
+
+def selected_jobs(
+    days: list[int], parts: list[str], input_dir: Path
+) -> list[tuple[int, str]]:
+    """Every (day, part) pair we were asked for that has an input on disk"""
+    jobs = []
+    for day in days:
+        if not input_path(day, input_dir).exists():
+            print(
+                f"skipping day {day}: no {input_path(day, input_dir)}", file=sys.stderr
+            )
+            continue
+        jobs.extend((day, part) for part in PARTS[day] if part in parts)
+    return jobs
+
+
+def load_history(path: Path) -> dict[tuple[int, str], float]:
+    """Mean wall time per (day, part) from an earlier --json run"""
+    return {
+        (result["day"], result["part"]): result["wall_mean"]
+        for result in json.loads(path.read_text())
+        if result.get("size") is None
+    }
+
+
+def longest_first(
+    jobs: list[tuple[int, str]], history: dict[tuple[int, str], float]
+) -> list[tuple[int, str]]:
+    """Order jobs so the slowest ones start first
+
+    Anything we've never timed goes to the front: it could be the slow one, and
+    starting it late is what stretches out a parallel run.
+    """
+    return sorted(jobs, key=lambda job: -history.get(job, float("inf")))
+
+
+def report(timing: Timing):
+    print(
+        f"day {timing.day:02} {timing.part}: {timing.wall_min:.4f}s wall"
+        f" {timing.cpu_mean:.4f}s cpu",
+        file=sys.stderr,
+    )
+
+
+def run_benchmarks(
+    days: list[int],
+    parts: list[str],
+    input_dir: Path,
+    runs: int = 1,
+    memory: bool = True,
+    verbose: bool = False,
+    warm: bool = False,
+    workers: int | None = None,
+    history: dict[tuple[int, str], float] | None = None,
+    profile: list[str] | None = None,
+    profile_dir: Path = Path("profiles"),
+) -> list[Timing]:
+    """Time every selected part, one at a time or on a process pool
+
+    With `workers`, each part is its own job, scheduled longest-expected-first
+    according to `history`.
+    """
+    jobs = selected_jobs(days, parts, input_dir)
+    results = []
+    if workers is None:
+        for day, part in jobs:
+            text = input_path(day, input_dir).read_text()
+            try:
+                timing = time_part(
+                    day,
+                    part,
+                    text,
+                    runs=runs,
+                    memory=memory,
+                    verbose=verbose,
+                    warm=warm,
+                    profile=profile,
+                    profile_dir=profile_dir,
+                )
+            except Exception as exc:
+                # one broken day shouldn't throw away everything else we timed
+                print(f"day {day:02} {part} failed: {exc!r}", file=sys.stderr)
+                continue
+            report(timing)
+            results.append(timing)
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers or None) as executor:
+        futures = {
+            executor.submit(
+                time_part,
+                day,
+                part,
+                input_path(day, input_dir).read_text(),
+                runs=runs,
+                memory=memory,
+                verbose=verbose,
+                warm=warm,
+                profile=profile,
+                profile_dir=profile_dir,
+            ): (day, part)
+            for day, part in longest_first(jobs, history or {})
+        }
+        for future in as_completed(futures):
+            day, part = futures[future]
+            try:
+                timing = future.result()
+            except Exception as exc:
+                print(f"day {day:02} {part} failed: {exc!r}", file=sys.stderr)
+                continue
+            report(timing)
+            results.append(timing)
+    return sorted(results, key=lambda timing: (timing.day, timing.part))
+
+
+def run_scaling(
+    days: list[int], parts: list[str], sizes: list[int], seed: int = 0, **kwargs
+) -> list[Timing]:
+    """Time every selected part on generated inputs of each size
+
+    Inputs come from `generators` with the same seed every time, so runs at
+    different sizes (or on different commits) are directly comparable.
+    """
+    results = []
+    profile_dir = kwargs.pop("profile_dir", Path("profiles"))
+    for size in sizes:
+        print(f"size {size}", file=sys.stderr)
+        with tempfile.TemporaryDirectory() as input_dir:
+            generators.write_inputs(days, size, seed, Path(input_dir))
+            for timing in run_benchmarks(
+                days,
+                parts,
+                Path(input_dir),
+                profile_dir=profile_dir / f"size{size}",
+                **kwargs,
+            ):
+                timing.size = size
+                results.append(timing)
+    return results
+
+
+def write_json(results: list[Timing], path: Path):
+    path.write_text(json.dumps([asdict(result) for result in results], indent=2))
+
+
+def write_csv(results: list[Timing], path: Path):
+    with path.open("w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(Timing.__dataclass_fields__))
+        writer.writeheader()
+        writer.writerows(asdict(result) for result in results)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=int,
+        default=list(DAYS),
+        help="days to run (default all)",
+    )
+    parser.add_argument(
+        "--part",
+        dest="parts",
+        action="append",
+        choices=sorted({part for parts in PARTS.values() for part in parts}),
+        help="only run this part (repeatable)",
+    )
+    parser.add_argument("--runs", type=int, default=1, help="runs per part")
+    parser.add_argument(
+        "--input-dir", type=Path, default=Path("."), help="where dayXX.txt lives"
+    )
+    parser.add_argument("--json", type=Path, help="write results as JSON here")
+    parser.add_argument("--csv", type=Path, help="write results as CSV here")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc run"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="let the solutions print"
+    )
+    parser.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="keep parsed inputs cached between runs of the same part",
+    )
+    parser.add_argument(
+        "--parse-cache-dir",
+        type=Path,
+        help="also pickle parsed inputs here so later invocations skip parsing",
+    )
+    parser.add_argument(
+        "--parallel",
+        dest="workers",
+        type=int,
+        nargs="?",
+        const=0,
+        help="run every part as its own job on a process pool of this size"
+        " (default one per CPU)",
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        help="earlier --json results used to start the slowest parts first"
+        " (defaults to the --json file if it already exists)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=profiling.MODES,
+        help="do one more run of each part under this profiler and write its"
+        " report to --profile-dir (repeatable)",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path("profiles"),
+        help="where --profile reports go (default ./profiles)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="time generated inputs of these sizes instead of dayXX.txt",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed for the generated inputs"
+    )
+    args = parser.parse_args(argv)
+    args.parts = args.parts or ["part_one", "part_two"]
+    return args
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    if args.parse_cache_dir:
+        parse_cache.configure(disk_dir=args.parse_cache_dir)
+        # so pool workers pick it up too, however they're started
+        os.environ["AOC_PARSE_CACHE_DIR"] = str(args.parse_cache_dir)
+    history_path = args.history or args.json
+    history = (
+        load_history(history_path) if history_path and history_path.exists() else {}
+    )
+    options = dict(
+        runs=args.runs,
+        memory=not args.no_memory,
+        verbose=args.verbose,
+        warm=args.warm_cache,
+        workers=args.workers,
+        history=history,
+        profile=args.profile,
+        profile_dir=args.profile_dir,
+    )
+    if args.sizes:
+        results = run_scaling(args.days, args.parts, args.sizes, args.seed, **options)
+    else:
+        results = run_benchmarks(args.days, args.parts, args.input_dir, **options)
+    if args.json:
+        write_json(results, args.json)
+    if args.csv:
+        write_csv(results, args.csv)
+    for result in results:
+        size = f" (size {result.size})" if result.size is not None else ""
+        print(f"day {result.day:02} {result.part}{size}: {result.answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""A long-running solver that keeps every day imported and every parse warm
+
+Start it once:
+
+    python daemon.py serve &
+
+then ask it for answers as often as you like:
+
+    python daemon.py ask 16 part_two
+    python daemon.py ask 16 part_two --input /tmp/other16.txt
+
+The server imports every day up front and stays up, so a query doesn't pay
+for interpreter start-up or imports, and the parse cache (see `parse_cache`)
+keeps each input's graphs, grids and distance tables around between queries.
+Answers are remembered by (day, part, input hash), so asking again for an
+input the server has already solved comes straight back; change the input and
+only that is recomputed. Like the parse cache, the server only holds on to the
+`max_entries` most recently used inputs (and their answers).
+
+The protocol is one JSON object per line over a Unix socket. A request is
+`{"day": 16, "part": "part_two", "input_hash": "..."}`, optionally with the
+`"input"` text itself. The client sends the hash alone first and only sends
+the text if the server replies that it hasn't seen that input. Replies carry
+either `answer`, `seconds` and `cached`, or an `error`.
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+import traceback
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import parse_cache
+import progress
+from benchmark import DAYS, PARTS, input_path, silenced
+
+DEFAULT_SOCKET = Path(
+    os.environ.get("AOC_DAEMON_SOCKET")
+    or Path(tempfile.gettempdir()) / f"aoc-{os.getuid()}.sock"
+)
+
+UNKNOWN_INPUT = "unknown input"
+
+
+def input_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """Serves one request at a time; the solutions share too much global state
+    (progress, counters, the parse cache) to run side by side"""
+
+    def __init__(self, socket_path: Path):
+        self.modules: dict[int, ModuleType] = {}
+        for day in DAYS:
+            try:
+                self.modules[day] = importlib.import_module(f"day{day:02}")
+            except Exception as exc:
+                print(f"day {day:02} unavailable: {exc!r}", file=sys.stderr)
+        # input hash -> text, least recently used first
+        self.inputs: OrderedDict[str, str] = OrderedDict()
+        self.answers: dict[tuple[int, str, str], str] = {}
+        progress.configure(enabled=False)
+        socket_path.unlink(missing_ok=True)
+        super().__init__(str(socket_path), SolverHandler)
+
+    def remember_input(self, key: str, text: str):
+        """Keep `text`, forgetting the least recently used inputs beyond the
+        parse cache's size (and every answer for them)"""
+        self.inputs[key] = text
+        self.inputs.move_to_end(key)
+        while len(self.inputs) > parse_cache.max_entries():
+            forgotten, _ = self.inputs.popitem(last=False)
+            self.answers = {
+                answer_key: answer
+                for answer_key, answer in self.answers.items()
+                if answer_key[2] != forgotten
+            }
+
+    def solve(self, request: dict[str, Any]) -> dict[str, Any]:
+        day = request["day"]
+        part = request["part"]
+        if day not in self.modules or part not in PARTS[day]:
+            return {"error": f"no day {day} {part}"}
+        if "input" in request:
+            key = input_hash(request["input"])
+            self.remember_input(key, request["input"])
+        else:
+            key = request["input_hash"]
+            if key not in self.inputs:
+                return {"error": UNKNOWN_INPUT}
+            self.inputs.move_to_end(key)
+        try:
+            return {
+                "answer": self.answers[day, part, key],
+                "seconds": 0,
+                "cached": True,
+            }
+        except KeyError:
+            pass
+        start = time.perf_counter()
+        with silenced(verbose=False):
+            answer = str(PARTS[day][part](self.modules[day], self.inputs[key]))
+        self.answers[day, part, key] = answer
+        return {
+            "answer": answer,
+            "seconds": time.perf_counter() - start,
+            "cached": False,
+        }
+
+
+class SolverHandler(socketserver.StreamRequestHandler):
+    server: SolverServer
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                reply = self.server.solve(json.loads(line))
+            except Exception:
+                reply = {"error": traceback.format_exc()}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+def serve(socket_path: Path = DEFAULT_SOCKET):
+    with SolverServer(socket_path) as server:
+        print(f"listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def ask(
+    day: int, part: str, text: str, socket_path: Path = DEFAULT_SOCKET
+) -> dict[str, Any]:
+    """Get one answer from a running server, sending the input only if needed"""
+    request = {"day": day, "part": part, "input_hash": input_hash(text)}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        stream = connection.makefile("rwb")
+        stream.write(json.dumps(request).encode() + b"\n")
+        stream.flush()
+        reply = json.loads(stream.readline())
+        if reply.get("error") == UNKNOWN_INPUT:
+            stream.write(json.dumps({**request, "input": text}).encode() + b"\n")
+            stream.flush()
+            reply = json.loads(stream.readline())
+    return reply
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="start the server")
+    ask_parser = commands.add_parser("ask", help="ask a running server")
+    ask_parser.add_argument("day", type=int)
+    ask_parser.add_argument("part", choices=["part_one", "part_two"])
+    ask_parser.add_argument("--input", type=Path, help="default ./dayXX.txt")
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        serve(args.socket)
+        return
+    path = args.input or input_path(args.day, Path("."))
+    reply = ask(args.day, args.part, path.read_text(), args.socket)
+    if "error" in reply:
+        sys.exit(reply["error"])
+    print(reply["answer"])
+    print(
+        f"{reply['seconds']:.4f}s{' (cached)' if reply['cached'] else ''}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,22 @@
 """Day 1: how many snacks are these elves packing?"""
+
+import heapq
+import json
+import os
+import re
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import chain, repeat
 from pathlib import Path
+from typing import Self
+
+from mapped_input import lines, mapped
+from parse_cache import cached
 
+# a blank line, whatever the line endings
+BLANK_LINE = re.compile(rb"\r?\n[ \t\r]*\n")
 
 TEST_INPUT = """1000
 2000
@@ -18,38 +34,211 @@ TEST_INPUT = """1000
 10000""".splitlines()
 
 
-def parse_input(lines: list[str]) -> list[int]:
-    elves = []
+def elf_totals(puzzle: Iterable[str]) -> Iterator[int]:
+    """Each elf's calories, as soon as we've seen the blank line after them"""
     interim = 0
-    for line in lines:
+    for line in puzzle:
         line = line.strip()
         if not line:
-            elves.append(interim)
+            yield interim
             interim = 0
         else:
             interim += int(line)
-    elves.append(interim)
-    return elves
-
-
-def part_one(puzzle_input: list[str]) -> int:
+    yield interim
+
+
+@cached
+def parse_input(puzzle: Iterable[str]) -> list[int]:
+    return list(elf_totals(puzzle))
+
+
+def top_elves(puzzle: Iterable[str], k: int = 3) -> list[int]:
+    """The k biggest totals, biggest first, in one pass and O(k) memory
+
+    Works straight off a stream of lines (say, `mapped_input.lines`), so the
+    whole input never has to be in memory at once. The first one is part one's
+    answer and the sum of the first three is part two's.
+    """
+    # a min-heap, so the smallest of the current top k is the one to beat
+    heap: list[int] = []
+    for total in elf_totals(puzzle):
+        if len(heap) < k:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+    return sorted(heap, reverse=True)
+
+
+def chunk_bounds(path: Path, chunks: int) -> list[tuple[int, int]]:
+    """Split the file into about `chunks` byte ranges that each hold whole elves
+
+    Every range ends just before a blank line and the next one starts just
+    after it, so no elf is ever split between two ranges.
+    """
+    with mapped(path) as data:
+        size = len(data)
+        bounds = []
+        start = 0
+        for chunk in range(1, chunks):
+            # the first line starting at or after the even split point
+            position = max(start, data.rfind(b"\n", 0, chunk * size // chunks) + 1)
+            while position < size:
+                line_end = data.find(b"\n", position)
+                if line_end == -1:
+                    line_end = size
+                if not data[position:line_end].strip():
+                    break
+                position = line_end + 1
+            if position >= size:
+                break
+            bounds.append((start, position))
+            start = line_end + 1
+        bounds.append((start, size))
+    return bounds
+
+
+def _mapped_elf_totals(data: bytes, start: int, end: int) -> Iterator[int]:
+    """Each elf's calories between two offsets of the mapped file
+
+    Only one elf's bytes are ever copied out of the map at a time, and int()
+    takes bytes, so nothing needs decoding line by line.
+    """
+    position = start
+    for blank in BLANK_LINE.finditer(data, start, end):
+        yield sum(map(int, data[position : blank.start()].split()))
+        position = blank.end()
+    yield sum(map(int, data[position:end].split()))
+
+
+def _chunk_top_elves(path: Path, start: int, end: int, k: int) -> list[int]:
+    with mapped(path) as data:
+        return heapq.nlargest(k, _mapped_elf_totals(data, start, end))
+
+
+def parallel_top_elves(path: Path, k: int = 3, workers: int | None = None) -> list[int]:
+    """`top_elves` for a huge file, with each core summing its own chunk
+
+    Each worker sends back its own chunk's top k, and the top k of those is
+    the top k overall.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = chunk_bounds(path, workers)
+    if len(bounds) == 1:
+        # not worth starting a pool for
+        return _chunk_top_elves(path, *bounds[0], k)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_tops = executor.map(
+            _chunk_top_elves,
+            repeat(path),
+            (start for start, _ in bounds),
+            (end for _, end in bounds),
+            repeat(k),
+        )
+        return heapq.nlargest(k, chain.from_iterable(chunk_tops))
+
+
+@dataclass
+class Checkpoint:
+    """Running totals for a calorie log that only ever grows
+
+    `catch_up` reads whatever's been appended since the last call, so keeping
+    the answers current costs time in proportion to the new lines only. The
+    elf still being listed at the end of the log counts towards the answers
+    as it stands, the same way `parse_input` would count it, but stays open
+    until a blank line closes it. Half-written last lines are left for next
+    time.
+    """
+
+    k: int = 3
+    # which file the log was (its inode), and how many bytes of it we've read
+    inode: int = 0
+    offset: int = 0
+    # calories so far for the elf that's still being listed
+    pending: int = 0
+    # min-heap of the biggest k closed elves
+    top: list[int] = field(default_factory=list)
+
+    def update(self, new_lines: Iterable[str]) -> Self:
+        """Fold in lines appended to the log (`offset` is the caller's problem)"""
+        for line in new_lines:
+            line = line.strip()
+            if line:
+                self.pending += int(line)
+                continue
+            if len(self.top) < self.k:
+                heapq.heappush(self.top, self.pending)
+            elif self.pending > self.top[0]:
+                heapq.heapreplace(self.top, self.pending)
+            self.pending = 0
+        return self
+
+    def catch_up(self, path: Path) -> Self:
+        """Read every complete line added to `path` since the last catch up"""
+        inode = path.stat().st_ino
+        with mapped(path) as data:
+            if inode != self.inode or len(data) < self.offset:
+                # a new log, or this one was truncated, so start over (a log
+                # rewritten in place at the same length or longer is missed)
+                self.inode = inode
+                self.offset = self.pending = 0
+                self.top = []
+            end = data.rfind(b"\n", self.offset) + 1
+            if end > self.offset:
+                self.update(data[self.offset : end].decode().splitlines())
+                self.offset = end
+        return self
+
+    def top_elves(self) -> list[int]:
+        """Like `top_elves(log)`, counting the open elf as it stands"""
+        return heapq.nlargest(self.k, [*self.top, self.pending])
+
+    def part_one(self) -> int:
+        return self.top_elves()[0]
+
+    def part_two(self) -> int:
+        return sum(self.top_elves()[:3])
+
+    def save(self, path: Path):
+        path.write_text(json.dumps(asdict(self)))
+
+    @classmethod
+    def load(cls, path: Path, k: int = 3) -> Self:
+        """The checkpoint saved at `path`, or a fresh one if there isn't one"""
+        try:
+            return cls(**json.loads(path.read_text()))
+        except FileNotFoundError:
+            return cls(k=k)
+
+
+def part_one(puzzle_input: Iterable[str]) -> int:
     elves = parse_input(puzzle_input)
     return max(elves)
 
 
-def part_two(puzzle_input: list[str]) -> int:
+def part_two(puzzle_input: Iterable[str]) -> int:
     elves = parse_input(puzzle_input)
-    elves = sorted(elves, reverse=True)
-    return sum(elves[:3])
+    return sum(heapq.nlargest(3, elves))
 
 
 def main():
     assert part_one(TEST_INPUT) == 24000, part_one(TEST_INPUT)
-    puzzle_file = Path("day01.txt")
-    puzzle_data = puzzle_file.read_text().splitlines()
-    print(part_one(puzzle_data))
     assert part_two(TEST_INPUT) == 45000, part_two(TEST_INPUT)
-    print(part_two(puzzle_data))
+    assert top_elves(TEST_INPUT) == [24000, 11000, 10000], top_elves(TEST_INPUT)
+    with tempfile.TemporaryDirectory() as scratch:
+        test_path = Path(scratch) / "day01.txt"
+        test_path.write_text("\n".join(TEST_INPUT) + "\n")
+        for workers in (1, 2, 4):
+            result = parallel_top_elves(test_path, workers=workers)
+            assert result == top_elves(TEST_INPUT), (workers, result)
+    # a log that arrives a few lines at a time ends up in the same place
+    checkpoint = Checkpoint()
+    for start in range(0, len(TEST_INPUT), 4):
+        checkpoint.update(TEST_INPUT[start : start + 4])
+    assert checkpoint.top_elves() == top_elves(TEST_INPUT), checkpoint
+    # both parts from one trip through the file
+    top_three = top_elves(lines(Path("day01.txt")))
+    print(top_three[0])
+    print(sum(top_three))
 
 
 if __name__ == "__main__":
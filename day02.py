@@ -1,4 +1,6 @@
 """Day 2: paper, rock, scissors"""
+
+from collections import Counter
 from pathlib import Path
 
 ME_ROCK = "X"
@@ -17,6 +19,9 @@ SCORES = {
     ME_SCISSORS: 3,
 }
 
+OPPONENT_HANDS = (OPPONENT_ROCK, OPPONENT_PAPER, OPPONENT_SCISSORS)
+MY_COLUMN = (ME_ROCK, ME_PAPER, ME_SCISSORS)
+
 LOSS = 0
 WIN = 6
 DRAW = 3
@@ -75,22 +80,100 @@ def play_round_part_2(turn: tuple[str, str]) -> int:
     return play_round((opponent, me))
 
 
+def score_table(play) -> tuple[tuple[int, ...], ...]:
+    """What `play` scores for every possible round, by [opponent][my column]"""
+    return tuple(
+        tuple(play((opponent, me)) for me in MY_COLUMN) for opponent in OPPONENT_HANDS
+    )
+
+
+# there are only nine different rounds, so score each of them once up front
+PART_ONE_SCORES = score_table(play_round)
+PART_TWO_SCORES = score_table(play_round_part_2)
+
+
+def tally_rounds(lines: Counter) -> list[list[int]]:
+    """Turn a count of raw lines into a count of rounds, by [opponent][my column]
+
+    There are only a handful of distinct lines, so tidying up odd spacing the
+    way `parse_input` would is cheap. Anything that still isn't a round is an
+    error rather than a round worth nothing.
+    """
+    rounds = Counter()
+    for line, count in lines.items():
+        rounds[" ".join(line.split())] += count
+    counts = [
+        [rounds.pop(f"{opponent} {me}", 0) for me in MY_COLUMN]
+        for opponent in OPPONENT_HANDS
+    ]
+    if rounds:
+        raise ValueError(f"not a round: {next(iter(rounds))!r}")
+    return counts
+
+
+def count_rounds(puzzle: list[str]) -> list[list[int]]:
+    """How many times each round comes up, by [opponent][my column]"""
+    return tally_rounds(Counter(puzzle))
+
+
+def count_rounds_in_text(text: str | bytes) -> list[list[int]]:
+    """`count_rounds` straight off the file contents, without splitting lines
+
+    A round can't straddle a line break, so each kind of round is just a
+    substring count, done in C with nothing made per line. That only adds up
+    if every line is exactly one round, so anything else (blank lines, odd
+    spacing, junk) is an error rather than rounds worth nothing.
+    """
+    if isinstance(text, str):
+        text = text.encode()
+    counts = [
+        [text.count(f"{opponent} {me}".encode()) for me in MY_COLUMN]
+        for opponent in OPPONENT_HANDS
+    ]
+    rounds = sum(map(sum, counts))
+    newlines = text.count(b"\n")
+    lines = newlines + 1 if text and not text.endswith(b"\n") else newlines
+    # rounds never overlap, so with no blank lines this leaves no room on any
+    # line for anything but its one round
+    if (
+        rounds != lines
+        or len(text) != 3 * rounds + newlines + text.count(b"\r")
+        or text.startswith((b"\n", b"\r\n"))
+        or b"\n\n" in text
+        or b"\n\r\n" in text
+    ):
+        raise ValueError("every line should be one round, like 'A Y'")
+    return counts
+
+
+def total_score(counts: list[list[int]], scores: tuple[tuple[int, ...], ...]) -> int:
+    return sum(
+        count * score
+        for count_row, score_row in zip(counts, scores)
+        for count, score in zip(count_row, score_row)
+    )
+
+
 def play_game(puzzle: list[str]) -> int:
-    game = parse_input(puzzle)
-    return sum(play_round(turn) for turn in game)
+    return total_score(count_rounds(puzzle), PART_ONE_SCORES)
 
 
 def play_part_two(puzzle: list[str]) -> int:
-    game = parse_input(puzzle)
-    return sum(play_round_part_2(turn) for turn in game)
+    return total_score(count_rounds(puzzle), PART_TWO_SCORES)
+
+
+def play_both(text: str | bytes) -> tuple[int, int]:
+    """Both parts' scores from one count of the whole input"""
+    counts = count_rounds_in_text(text)
+    return total_score(counts, PART_ONE_SCORES), total_score(counts, PART_TWO_SCORES)
 
 
 def main():
-    real_puzzle = Path("day02.txt").read_text().splitlines()
     assert play_game(TEST_INPUT) == 15, play_game(TEST_INPUT)
-    print(play_game(real_puzzle))
     assert play_part_two(TEST_INPUT) == 12, play_part_two(TEST_INPUT)
-    print(play_part_two(real_puzzle))
+    assert play_both("\n".join(TEST_INPUT)) == (15, 12)
+    for score in play_both(Path("day02.txt").read_bytes()):
+        print(score)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
 """Day 3: rucksack reorg"""
 
 from pathlib import Path
+from string import ascii_lowercase, ascii_uppercase
 from collections.abc import Generator
 
-
 TEST_INPUT = """vJrwpWtwJgWrhcsFMMfFFhFp
 jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
 PmmdzqPrVvPwwTWBwg
@@ -12,18 +12,20 @@ ttgJtRGJQctTZtZT
 CrZsJsPPZsGzwwsLwLmpwMDw
 """.splitlines()
 
+PRIORITIES = {
+    item: priority
+    for priority, item in enumerate(ascii_lowercase + ascii_uppercase, start=1)
+}
+
 
 def rucksack_priority(rucksack: str) -> int:
     split = len(rucksack) // 2
     assert len(rucksack) / 2 == split
-    pack1 = rucksack[:split]
-    pack2 = rucksack[split:]
-    union = set(pack1) & set(pack2)
+    # intersecting with the other half as a plain string saves building a
+    # second set
+    union = set(rucksack[:split]).intersection(rucksack[split:])
     assert len(union) == 1, union
-    commonality = union.pop()
-    if commonality.lower() == commonality:
-        return ord(commonality) - ord("a") + 1
-    return ord(commonality) - ord("A") + 27
+    return PRIORITIES[union.pop()]
 
 
 def part_one(puzzle: list[str]) -> int:
@@ -39,18 +41,80 @@ def chunks(lst: list[int], n: int) -> Generator[str, None, None]:
 def part_two(puzzle: list[str]) -> int:
     total = 0
     for sack1, sack2, sack3 in chunks(puzzle, 3):
-        union = set(sack1) & set(sack2) & set(sack3)
+        union = set(sack1).intersection(sack2, sack3)
         assert len(union) == 1, union
-        commonality = union.pop()
-        if commonality.lower() == commonality:
-            total += ord(commonality) - ord("a") + 1
-        else:
-            total += ord(commonality) - ord("A") + 27
+        total += PRIORITIES[union.pop()]
     return total
 
 
+def _line_bounds(numpy, data):
+    """Where each non-empty line starts and ends, leaving off any carriage return"""
+    if not len(data):
+        empty = numpy.empty(0, dtype=numpy.intp)
+        return empty, empty
+    newlines = numpy.flatnonzero(data == ord("\n"))
+    starts = numpy.concatenate(([0], newlines + 1))
+    ends = numpy.concatenate((newlines, [len(data)]))
+    ends -= data[numpy.maximum(ends - 1, 0)] == ord("\r")
+    keep = ends > starts
+    return starts[keep], ends[keep]
+
+
+def _item_bits(numpy, text: str | bytes):
+    """One 52-bit mask per byte of input (0 for anything that isn't an item)"""
+    table = numpy.zeros(256, dtype=numpy.uint64)
+    for item, priority in PRIORITIES.items():
+        table[ord(item)] = 1 << (priority - 1)
+    data = numpy.frombuffer(
+        text.encode() if isinstance(text, str) else text, dtype=numpy.uint8
+    )
+    return data, table[data]
+
+
+def _mask_priorities(numpy, masks) -> int:
+    """Sum of the priorities of the single item left in each mask"""
+    # zero is nothing in common; anything else but a power of two is too much
+    assert numpy.all(masks != 0), "no items in common"
+    assert numpy.all(masks & (masks - numpy.uint64(1)) == 0), "items in common != 1"
+    # every mask is a power of two below 2**52, so log2 is exact
+    return int(numpy.log2(masks).sum() + len(masks))
+
+
+def part_one_numpy(text: str | bytes) -> int:
+    """`part_one` for the whole input at once, with NumPy doing the looping
+
+    Every byte becomes its item's bit, each compartment's bits are OR-ed
+    together in a single `reduceat`, and AND-ing the two halves of each line
+    leaves just the shared item.
+    """
+    import numpy
+
+    data, bits = _item_bits(numpy, text)
+    starts, ends = _line_bounds(numpy, data)
+    compartments = numpy.empty(2 * len(starts), dtype=numpy.intp)
+    compartments[0::2] = starts
+    compartments[1::2] = starts + (ends - starts) // 2
+    # each compartment's bits run up to the next one's start; the newline in
+    # between has no bits, so it doesn't matter
+    masks = numpy.bitwise_or.reduceat(bits, compartments)
+    return _mask_priorities(numpy, masks[0::2] & masks[1::2])
+
+
+def part_two_numpy(text: str | bytes) -> int:
+    """`part_two` for the whole input at once, with NumPy doing the looping"""
+    import numpy
+
+    data, bits = _item_bits(numpy, text)
+    starts, _ = _line_bounds(numpy, data)
+    groups = numpy.bitwise_or.reduceat(bits, starts).reshape(-1, 3)
+    return _mask_priorities(numpy, groups[:, 0] & groups[:, 1] & groups[:, 2])
+
+
 def main():
     assert part_one(TEST_INPUT) == 157, part_one(TEST_INPUT)
+    test_text = "\n".join(TEST_INPUT)
+    assert part_one_numpy(test_text) == 157, part_one_numpy(test_text)
+    assert part_two_numpy(test_text) == 70, part_two_numpy(test_text)
     real_input = Path("day03.txt").read_text().splitlines()
     print(part_one(real_input))
     assert part_two(TEST_INPUT) == 70, part_two(TEST_INPUT)
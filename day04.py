@@ -1,6 +1,12 @@
 """Day 4: cleanup on aisle 4"""
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
 from pathlib import Path
+from typing import Self
+
+from mapped_input import lines
 
 TEST_INPUT = """2-4,6-8
 2-3,4-5
@@ -9,8 +15,11 @@ TEST_INPUT = """2-4,6-8
 6-6,4-6
 2-6,4-8""".splitlines()
 
+# section ranges only ever have dashes and commas between the numbers
+SEPARATORS = str.maketrans("-,", "  ")
+
 
-def parse_input(puzzle: list[str]) -> list[tuple[int, int, int, int]]:
+def parse_input(puzzle: Iterable[str]) -> list[tuple[int, int, int, int]]:
     parsed = []
     for line in puzzle:
         range1, range2 = line.split(",")
@@ -31,18 +40,231 @@ def part_one(puzzle: list[tuple[int, int, int, int]]):
 def part_two(puzzle: list[tuple[int, int, int, int]]):
     overlaps = 0
     for start1, end1, start2, end2 in puzzle:
-        set1 = set(range(start1, end1 + 1))
-        set2 = set(range(start2, end2 + 1))
-        if set1.intersection(set2):
+        # neither one ends before the other starts
+        if start1 <= end2 and start2 <= end1:
             overlaps += 1
     return overlaps
 
 
+def parse_numpy(text: str):
+    """Every pair as a row of an (n, 4) NumPy array: start1, end1, start2, end2"""
+    import numpy
+
+    return numpy.fromstring(
+        text.translate(SEPARATORS), dtype=numpy.int64, sep=" "
+    ).reshape(-1, 4)
+
+
+def part_one_numpy(text: str) -> int:
+    """`part_one` on the raw input text, as array operations"""
+    start1, end1, start2, end2 = parse_numpy(text).T
+    return int(
+        (
+            ((start1 >= start2) & (end1 <= end2))
+            | ((start1 <= start2) & (end1 >= end2))
+        ).sum()
+    )
+
+
+def part_two_numpy(text: str) -> int:
+    """`part_two` on the raw input text, as array operations"""
+    start1, end1, start2, end2 = parse_numpy(text).T
+    return int(((start1 <= end2) & (start2 <= end1)).sum())
+
+
+Section = tuple[int, int]
+
+
+class _Node:
+    """One node of a centered interval tree
+
+    Holds every interval that covers `center`, once sorted by start and once
+    by end (latest first), plus subtrees for the intervals entirely to either
+    side of it.
+    """
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, sections: list[Section]):
+        starts = sorted(start for start, _ in sections)
+        self.center = starts[len(starts) // 2]
+        here = []
+        left = []
+        right = []
+        for section in sections:
+            if section[1] < self.center:
+                left.append(section)
+            elif section[0] > self.center:
+                right.append(section)
+            else:
+                here.append(section)
+        self.by_start = sorted(here)
+        self.by_end = sorted(here, key=lambda section: section[1], reverse=True)
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+
+class _StartTree:
+    """A merge-sort tree over intervals sorted by start
+
+    Leaf i holds the i-th interval by start, and every node holds the
+    intervals of the leaves under it sorted by end (plus those ends alone, to
+    bisect). The first `count` intervals by start are covered by O(log n)
+    nodes, and in each of those the intervals ending late enough are a suffix.
+    """
+
+    __slots__ = ("size", "by_end", "ends")
+
+    def __init__(self, by_start: list[Section]):
+        self.size = size = len(by_start)
+        self.by_end = [[] for _ in range(size)] + [[section] for section in by_start]
+        self.ends = [[] for _ in range(size)] + [[end] for _, end in by_start]
+        for node in range(size - 1, 0, -1):
+            # both halves are already sorted, which sorted() merges in one pass
+            self.by_end[node] = sorted(
+                self.by_end[2 * node] + self.by_end[2 * node + 1], key=itemgetter(1)
+            )
+            self.ends[node] = sorted(self.ends[2 * node] + self.ends[2 * node + 1])
+
+    def _prefix_nodes(self, count: int) -> Iterator[int]:
+        """The nodes that between them hold exactly the first `count` leaves"""
+        low = self.size
+        high = self.size + count
+        while low < high:
+            if low & 1:
+                yield low
+                low += 1
+            if high & 1:
+                high -= 1
+                yield high
+            low >>= 1
+            high >>= 1
+
+    def count_reaching(self, count: int, end: int) -> int:
+        """How many of the first `count` intervals reach `end`"""
+        return sum(
+            len(self.ends[node]) - bisect_left(self.ends[node], end)
+            for node in self._prefix_nodes(count)
+        )
+
+    def reaching(self, count: int, end: int) -> list[Section]:
+        """Those of the first `count` intervals that reach `end`"""
+        found = []
+        for node in self._prefix_nodes(count):
+            found.extend(self.by_end[node][bisect_left(self.ends[node], end) :])
+        return found
+
+
+class IntervalIndex:
+    """Every elf's assignment, indexed for "who else works on these sections?"
+
+    Counting assignments that overlap a range is two binary searches over the
+    sorted starts and ends, O(log n). Listing them walks a centered interval
+    tree, O(log n + k) for k results.
+
+    Containment needs a start at or before the range's and an end at or after
+    it, which a merge-sort tree over the starts answers: O(log² n) to count
+    and O(log² n + k) to list.
+    """
+
+    __slots__ = ("starts", "ends", "root", "start_tree")
+
+    def __init__(self, sections: Iterable[Section]):
+        sections = list(sections)
+        self.starts = sorted(start for start, _ in sections)
+        self.ends = sorted(end for _, end in sections)
+        self.root = _Node(sections) if sections else None
+        self.start_tree = _StartTree(sorted(sections))
+
+    @classmethod
+    def from_pairs(cls, puzzle: Iterable[tuple[int, int, int, int]]) -> Self:
+        """Index both assignments of every pair from `parse_input`"""
+        return cls(
+            section
+            for start1, end1, start2, end2 in puzzle
+            for section in ((start1, end1), (start2, end2))
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def count_overlapping(self, start: int, end: int) -> int:
+        """How many assignments share at least one section with start-end"""
+        # everything that starts by the end of the range, less whatever of
+        # that ends before the range starts (which must have started earlier)
+        return bisect_right(self.starts, end) - bisect_left(self.ends, start)
+
+    def overlapping(self, start: int, end: int) -> list[Section]:
+        """Every assignment that shares at least one section with start-end"""
+        found = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if end < node.center:
+                # everything here reaches the center, so it's past `end` too
+                for section in node.by_start:
+                    if section[0] > end:
+                        break
+                    found.append(section)
+            elif start > node.center:
+                for section in node.by_end:
+                    if section[1] < start:
+                        break
+                    found.append(section)
+            else:
+                found.extend(node.by_start)
+            if node.left and start < node.center:
+                stack.append(node.left)
+            if node.right and end > node.center:
+                stack.append(node.right)
+        return found
+
+    def containing(self, start: int, end: int) -> list[Section]:
+        """Every assignment that covers all of start-end"""
+        return self.start_tree.reaching(bisect_right(self.starts, start), end)
+
+    def count_containing(self, start: int, end: int) -> int:
+        """How many assignments cover all of start-end"""
+        return self.start_tree.count_reaching(bisect_right(self.starts, start), end)
+
+    def count_overlapping_many(self, queries: Iterable[Section]) -> list[int]:
+        """`count_overlapping` for a batch of ranges"""
+        starts = self.starts
+        ends = self.ends
+        return [
+            bisect_right(starts, end) - bisect_left(ends, start)
+            for start, end in queries
+        ]
+
+    def overlapping_many(self, queries: Iterable[Section]) -> list[list[Section]]:
+        """`overlapping` for a batch of ranges"""
+        return [self.overlapping(start, end) for start, end in queries]
+
+    def containing_many(self, queries: Iterable[Section]) -> list[list[Section]]:
+        """`containing` for a batch of ranges"""
+        return [self.containing(start, end) for start, end in queries]
+
+
 def main():
-    real_input = Path("day04.txt").read_text().splitlines()
     test_puzzle = parse_input(TEST_INPUT)
-    real_puzzle = parse_input(real_input)
+    real_puzzle = parse_input(lines(Path("day04.txt")))
     assert part_one(test_puzzle) == 2, part_one(test_puzzle)
+    test_text = "\n".join(TEST_INPUT)
+    assert part_one_numpy(test_text) == 2, part_one_numpy(test_text)
+    assert part_two_numpy(test_text) == 4, part_two_numpy(test_text)
+    index = IntervalIndex.from_pairs(test_puzzle)
+    assert len(index) == 12, len(index)
+    # who else is working on section 6?
+    on_six = [(2, 6), (2, 8), (3, 7), (4, 6), (4, 8), (5, 7), (6, 6), (6, 8)]
+    assert sorted(index.overlapping(6, 6)) == on_six, index.overlapping(6, 6)
+    assert index.count_overlapping(6, 6) == 8, index.count_overlapping(6, 6)
+    assert index.overlapping(1, 1) == [], index.overlapping(1, 1)
+    assert index.count_overlapping(1, 1) == 0, index.count_overlapping(1, 1)
+    # ... and on all of 3-7?
+    assert sorted(index.containing(3, 7)) == [(2, 8), (3, 7)], index.containing(3, 7)
+    assert index.count_containing(3, 7) == 2, index.count_containing(3, 7)
+    assert index.containing(1, 9) == [], index.containing(1, 9)
+    assert index.count_containing(1, 9) == 0, index.count_containing(1, 9)
     print(part_one(real_puzzle))
     assert part_two(test_puzzle) == 4, part_two(test_puzzle)
     print(part_two(real_puzzle))
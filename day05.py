@@ -25,45 +25,49 @@ def crate_number(line_index: int) -> int:
 def parse_input(
     puzzle: list[str],
 ) -> tuple[list[list[str]], list[tuple[int, int, int]]]:
-    # my test input has 1 through 9, so this is a cheat
-    crates = [list() for _ in range(10)]
+    crate_rows = []
+    crates = []
     instructions = []
 
-    parsing_crates = True
-
     for line in puzzle:
-        if not line:
+        if not line.strip():
             continue
         if line.startswith("move"):
-            parsing_crates = False
-        if parsing_crates:
-            for index, char in enumerate(line):
-                if char in ascii_uppercase:
-                    # we have a crate
-                    crate = crate_number(index)
-                    crates[crate].append(char)
-        else:
             words = line.split()
             instructions.append((int(words[1]), int(words[3]), int(words[5])))
-    for crate in crates:
-        # Here's the big key for the puzzle:
-        # the lines you read are in reverse order
-        # so you need to reverse each crate container
-        crate.reverse()
+        elif "[" in line:
+            crate_rows.append(line)
+        else:
+            # the row numbering the stacks, which says how many there are;
+            # stack 0 stays empty so the instructions' numbers work as indexes
+            crates = [list() for _ in range(int(line.split()[-1]) + 1)]
+    # Here's the big key for the puzzle:
+    # the lines you read are in reverse order
+    # so go through them from the bottom up
+    for line in reversed(crate_rows):
+        for index, char in enumerate(line):
+            if char in ascii_uppercase:
+                # we have a crate
+                crates[crate_number(index)].append(char)
     return crates, instructions
 
 
 def move_crate(crates: list[list[str]], qty: int, source: int, target: int):
     assert source != target
-    for _ in range(qty):
-        crates[target].append(crates[source].pop())
+    # one crate at a time means the moved crates land upside down
+    stack = crates[source]
+    split = len(stack) - qty
+    crates[target].extend(reversed(stack[split:]))
+    del stack[split:]
 
 
 def move_crate_p2(crates: list[list[str]], qty: int, source: int, target: int):
     assert source != target
-    removed = crates[source][-qty:]
-    del crates[source][-qty:]
-    crates[target].extend(removed)
+    # (not stack[-qty:], which would be the whole stack when qty is 0)
+    stack = crates[source]
+    split = len(stack) - qty
+    crates[target].extend(stack[split:])
+    del stack[split:]
 
 
 def part_one(crates: list[list[str]], instructions: list[tuple[int, int, int]]) -> str:
@@ -78,8 +82,55 @@ def part_two(crates: list[list[str]], instructions: list[tuple[int, int, int]])
     return "".join(crate[-1] for crate in crates if crate)
 
 
+def top_crates_backwards(
+    crates: list[list[str]],
+    instructions: list[tuple[int, int, int]],
+    keep_order: bool,
+) -> str:
+    """What ends up on top of each stack, without moving a single crate
+
+    Only the stack heights are played forwards. Then each final top is
+    followed back through the instructions as a (stack, depth from the top)
+    position until we know where it started out. That costs time per
+    instruction per stack, however many crates each move shifts. Set
+    `keep_order` for the CrateMover 9001, which doesn't flip what it moves.
+    """
+    heights = [len(stack) for stack in crates]
+    for qty, source, target in instructions:
+        heights[source] -= qty
+        heights[target] += qty
+    positions = [(stack, 0) for stack, height in enumerate(heights) if height]
+    for qty, source, target in reversed(instructions):
+        for index, (stack, depth) in enumerate(positions):
+            if stack == target:
+                if depth < qty:
+                    # this crate was part of the move
+                    positions[index] = (
+                        source,
+                        depth if keep_order else qty - 1 - depth,
+                    )
+                else:
+                    positions[index] = (stack, depth - qty)
+            elif stack == source:
+                positions[index] = (stack, depth + qty)
+    return "".join(crates[stack][-1 - depth] for stack, depth in positions)
+
+
+def part_one_backwards(
+    crates: list[list[str]], instructions: list[tuple[int, int, int]]
+) -> str:
+    return top_crates_backwards(crates, instructions, keep_order=False)
+
+
+def part_two_backwards(
+    crates: list[list[str]], instructions: list[tuple[int, int, int]]
+) -> str:
+    return top_crates_backwards(crates, instructions, keep_order=True)
+
+
 def main():
     test_crates, test_instructions = parse_input(TEST_INPUT)
+    assert part_one_backwards(test_crates, test_instructions) == "CMZ"
     part_one_result = part_one(test_crates, test_instructions)
     assert part_one_result == "CMZ"
 
@@ -88,6 +139,7 @@ def main():
 
     print(part_one(real_crates, real_instructions))
     test_crates, test_instructions = parse_input(TEST_INPUT)
+    assert part_two_backwards(test_crates, test_instructions) == "MCD"
 
     # simply slicing (e.g. test_crates[:]) is not enough to preserve
     # the original list because it'll still point to the same interior
@@ -1,6 +1,11 @@
 """Day 6: tuning trouble"""
 
+import io
+from collections.abc import Iterable
 from pathlib import Path
+from typing import BinaryIO
+
+CHUNK_SIZE = 64 * 1024
 
 TEST_INPUTS = {
     "mjqjpqmgbljsphdztnvjfqwrcgsmlb": (7, 19),
@@ -12,11 +17,18 @@ TEST_INPUTS = {
 
 
 def min_offset_before_distinct_chars(puzzle: str, min_distinct: int) -> int:
-    for index in range(min_distinct, len(puzzle) + 1):
-        most_recent = puzzle[index - min_distinct : index]
-        assert len(most_recent) == min_distinct
-        if len(set(most_recent)) == min_distinct:
-            return index
+    # the window of distinct characters ending at the current one starts
+    # just after the last repeat of anything in it, so remembering where each
+    # character was last seen is enough to slide it along in one pass
+    last_seen: dict[str, int] = {}
+    window_start = 0
+    for index, char in enumerate(puzzle):
+        previous = last_seen.get(char, -1)
+        if previous >= window_start:
+            window_start = previous + 1
+        last_seen[char] = index
+        if index - window_start + 1 == min_distinct:
+            return index + 1
 
 
 def part_one(puzzle: str) -> int:
@@ -29,13 +41,86 @@ def part_two(puzzle: str) -> int:
     return min_offset_before_distinct_chars(puzzle, 14)
 
 
+class MarkerDetector:
+    """Finds markers of several sizes at once in a signal fed in any chunks
+
+    This is the same sliding window as `min_offset_before_distinct_chars`,
+    which serves every marker size at once: a marker of size n ends wherever
+    the run of distinct characters first reaches n. All that's carried from
+    one chunk to the next is where each byte was last seen and where the
+    current run started, so an endless stream takes constant memory.
+    """
+
+    __slots__ = ("sizes", "markers", "offset", "_last_seen", "_run_start")
+
+    def __init__(self, sizes: Iterable[int] = (4, 14)):
+        self.sizes = sorted(set(sizes))
+        # marker size -> characters in before the marker is done
+        self.markers: dict[int, int] = {}
+        self.offset = 0
+        self._last_seen = [-1] * 256
+        self._run_start = 0
+
+    @property
+    def done(self) -> bool:
+        return len(self.markers) == len(self.sizes)
+
+    def feed(self, chunk: bytes) -> dict[int, int]:
+        """Scan the next chunk of the signal; returns any markers it finished"""
+        found = {}
+        waiting = [size for size in self.sizes if size not in self.markers]
+        if not waiting:
+            return found
+        last_seen = self._last_seen
+        run_start = self._run_start
+        index = self.offset
+        for byte in chunk:
+            previous = last_seen[byte]
+            if previous >= run_start:
+                run_start = previous + 1
+            last_seen[byte] = index
+            index += 1
+            if index - run_start == waiting[0]:
+                found[waiting.pop(0)] = index
+                if not waiting:
+                    break
+        self.offset += len(chunk)
+        self._run_start = run_start
+        self.markers.update(found)
+        return found
+
+
+def scan(
+    stream: BinaryIO, sizes: Iterable[int] = (4, 14), chunk_size: int = CHUNK_SIZE
+) -> dict[int, int]:
+    """Read `stream` (a file, or a socket's `makefile("rb")`) until every marker
+    size has turned up, or the stream ends
+
+    Sizes that never turn up are left out of the result. Buffered streams are
+    read with `read1`, which hands back whatever has arrived rather than
+    waiting for a whole chunk, so a marker early in a slow stream is found as
+    soon as it arrives.
+    """
+    detector = MarkerDetector(sizes)
+    read = getattr(stream, "read1", stream.read)
+    while not detector.done and (chunk := read(chunk_size)):
+        detector.feed(chunk)
+    return detector.markers
+
+
 def main():
     for puzzle, (answer, p2_answer) in TEST_INPUTS.items():
         assert part_one(puzzle) == answer, (puzzle, answer, part_one(puzzle))
         assert part_two(puzzle) == p2_answer, (puzzle, p2_answer, part_two(puzzle))
-    real_puzzle = Path("day06.txt").read_text().strip()
-    print(part_one(real_puzzle))
-    print(part_two(real_puzzle))
+        assert scan(io.BytesIO(puzzle.encode()), chunk_size=3) == {
+            4: answer,
+            14: p2_answer,
+        }
+    # both markers from one pass over the file
+    with Path("day06.txt").open("rb") as signal:
+        markers = scan(signal)
+    print(markers[4])
+    print(markers[14])
 
 
 if __name__ == "__main__":
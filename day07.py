@@ -1,6 +1,13 @@
-from typing import Any
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import accumulate
 from pathlib import Path
-from collections import defaultdict
+from typing import Self
+
+from parse_cache import cached
+
+TOTAL_DISK_SPACE = 70_000_000
+SPACE_NEEDED = 30_000_000
 
 TEST_INPUT = """$ cd /
 $ ls
@@ -27,114 +34,185 @@ $ ls
 7214296 k""".splitlines()
 
 
-def parse_input(puzzle: list[str]) -> dict[str, Any]:
-    working_dir = "/"
-    file_system = {}
+class Directory:
+    """A directory whose `size` always includes everything beneath it"""
+
+    __slots__ = ("name", "parent", "children", "files", "size")
+
+    def __init__(self, name: str, parent: Self | None = None):
+        self.name = name
+        self.parent = parent
+        self.children: dict[str, Directory] = {}
+        self.files: dict[str, int] = {}
+        self.size = 0
+
+    def subdirectory(self, name: str) -> Self:
+        try:
+            return self.children[name]
+        except KeyError:
+            child = self.children[name] = Directory(name, self)
+            return child
+
+    def add_file(self, name: str, size: int):
+        """Record a file here, and its size in every directory above"""
+        # listing the same directory twice shouldn't count its files twice
+        change = size - self.files.get(name, 0)
+        self.files[name] = size
+        directory = self
+        while directory is not None:
+            directory.size += change
+            directory = directory.parent
+
+    @property
+    def path(self) -> str:
+        names = []
+        directory = self
+        while directory.parent is not None:
+            names.append(directory.name)
+            directory = directory.parent
+        return "/" + "/".join(reversed(names))
+
+    def walk(self) -> Iterator[Self]:
+        """This directory and everything under it"""
+        stack = [self]
+        while stack:
+            directory = stack.pop()
+            yield directory
+            stack.extend(directory.children.values())
+
+
+def replay(puzzle: Iterable[str], root: Directory) -> Iterator[Directory]:
+    """Play a terminal session into the tree under `root`, a line at a time
+
+    Yields each directory as we cd out of it, then at the end of the session
+    everything from the working directory back up to the root, so every
+    directory comes out after everything under it. Only the tree is kept, so
+    the transcript can be as long as it likes.
+    """
+    working_dir = root
     for line in puzzle:
         if line.startswith("$"):
             cmd = line[2:].split()
             if cmd[0] == "cd":
                 if cmd[1] == "/":
-                    working_dir = "/"
-                    file_system.setdefault("/", {})
+                    while working_dir is not root:
+                        yield working_dir
+                        working_dir = working_dir.parent
                 elif cmd[1] == "..":
-                    if working_dir.endswith("/"):
-                        working_dir = working_dir[:-1]
-                    working_dir = "/".join(working_dir.split("/")[:-1]) + "/"
+                    if working_dir is not root:
+                        yield working_dir
+                        working_dir = working_dir.parent
                 else:
-                    working_dir = f"{working_dir}/{cmd[1]}/".replace("//", "/")
-                    interim_fs = file_system["/"]
-                    for part in (
-                        working_dir
-                        if not working_dir.endswith("/")
-                        else working_dir[:-1]
-                    ).split("/"):
-                        if part:
-                            try:
-                                interim_fs = interim_fs[part]
-                            except KeyError:
-                                interim_fs[part] = {}
-                                interim_fs = interim_fs[part]
-
-            elif cmd[0] == "ls":
-                continue
-            else:
+                    working_dir = working_dir.subdirectory(cmd[1])
+            elif cmd[0] != "ls":
                 raise ValueError(f"Unknown command {line}")
             continue
-        # we're parrsing a directory output
-        interim_fs = file_system["/"]
-        for part in (
-            working_dir if not working_dir.endswith("/") else working_dir[:-1]
-        ).split("/"):
-            if part:
-                try:
-                    interim_fs = interim_fs[part]
-                except KeyError:
-                    interim_fs[part] = {}
-                    interim_fs = interim_fs[part]
+        # we're parsing a directory listing
         size_or_type, name = line.split()
         if size_or_type == "dir":
-            interim_fs[name] = {}
-        else:
-            interim_fs[name] = int(size_or_type)
-
-    assert list(file_system) == ["/"]
-    return file_system
-
-
-def dir_size(
-    current_path: str,
-    directory: dict[str, Any],
-    result: defaultdict[str, int],
-    depth: int = 0,
-) -> int:
-    retval = 0
-    for name, contents in directory.items():
-        if isinstance(contents, int):
-            # print(' ' * depth, 'found file',name, contents)
-            retval += contents
+            working_dir.subdirectory(name)
         else:
-            # print(' ' * depth, 'entering subdir', name)
-            # it's a dict
-            # recursively add up its size
-            new_dir = f"{current_path}/{name}".replace("//", "/")
-            # print(new_dir)
-            assert new_dir not in result
-            result[new_dir] = dir_size(new_dir, contents, result, depth + 1)
-            # and add that child's total to our own
-            retval += result[new_dir]
-    # print(' ' * depth, f'returning {retval}')
-    return retval
+            working_dir.add_file(name, int(size_or_type))
+    while working_dir is not None:
+        yield working_dir
+        working_dir = working_dir.parent
+
+
+@cached
+def parse_input(puzzle: Iterable[str]) -> Directory:
+    root = Directory("/")
+    for _ in replay(puzzle, root):
+        pass
+    return root
+
+
+def stream_sizes(puzzle: Iterable[str]) -> Iterator[tuple[str, int]]:
+    """(path, total size) for each directory as soon as the session leaves it
+
+    A directory that's visited again later comes out again with its new
+    total, so the last size seen for a path is the final one. The root always
+    comes out last, with the size of everything.
+    """
+    for directory in replay(puzzle, Directory("/")):
+        yield directory.path, directory.size
+
+
+def directory_sizes(root: Directory) -> dict[str, int]:
+    """Total size of every directory, the root included"""
+    return {directory.path: directory.size for directory in root.walk()}
+
+
+class SizeIndex:
+    """Every directory's size (the root's included), sorted once so cleanup
+    questions are a bisect"""
+
+    __slots__ = ("sizes", "running_totals", "used")
+
+    def __init__(self, root: Directory):
+        self.sizes = sorted(directory.size for directory in root.walk())
+        # running_totals[i] is the sum of the i smallest sizes
+        self.running_totals = list(accumulate(self.sizes, initial=0))
+        self.used = root.size
+
+    def total_at_most(self, threshold: int) -> int:
+        """Sum of the sizes of every directory no bigger than `threshold`"""
+        return self.running_totals[bisect_right(self.sizes, threshold)]
+
+    def smallest_at_least(self, size: int) -> int | None:
+        """The smallest directory size of at least `size`, if there is one"""
+        index = bisect_left(self.sizes, size)
+        return self.sizes[index] if index < len(self.sizes) else None
+
+    def smallest_freeing(
+        self, space_needed: int = SPACE_NEEDED, disk_size: int = TOTAL_DISK_SPACE
+    ) -> int | None:
+        """Size of the smallest directory that leaves `space_needed` free
+
+        Deleting the root frees the whole disk, so this is only None when
+        `space_needed` is more than `disk_size`.
+        """
+        return self.smallest_at_least(space_needed - (disk_size - self.used))
+
+    def total_at_most_many(self, thresholds: Iterable[int]) -> list[int]:
+        return [self.total_at_most(threshold) for threshold in thresholds]
+
+    def smallest_freeing_many(
+        self, plans: Iterable[tuple[int, int]]
+    ) -> list[int | None]:
+        """`smallest_freeing` for each (space needed, disk size)"""
+        return [
+            self.smallest_freeing(space_needed, disk_size)
+            for space_needed, disk_size in plans
+        ]
+
+
+@cached
+def size_index(puzzle: list[str]) -> SizeIndex:
+    return SizeIndex(parse_input(puzzle))
 
 
 def part_one(puzzle: list[str], target: int = 100000) -> int:
-    file_system = parse_input(puzzle)
-    sizes = defaultdict(int)
-    dir_size("", file_system, sizes)
-    return sum(size for size in sizes.values() if size <= target)
+    return size_index(puzzle).total_at_most(target)
 
 
 def part_two(puzzle: list[str]) -> int:
-    file_system = parse_input(puzzle)
-    sizes = defaultdict(int)
-    slash_size = dir_size("", file_system, sizes)
-    total_disk_space = 70_000_000
-    threshold = 30_000_000
-    space_avail = total_disk_space - slash_size
-    # print('currently unused:', space_avail)
-    for name, space_taken in sorted(sizes.items(), key=lambda k: k[1]):
-        if space_avail + space_taken >= threshold:
-            # print(f'removing {name} would work')
-            return space_taken
+    return size_index(puzzle).smallest_freeing()
 
 
 def main():
     part_one_result = part_one(TEST_INPUT)
     assert part_one_result == 95437, part_one_result
+    # the root counts too when it's small enough
+    tiny = ["$ cd /", "$ ls", "100 a", "dir b", "$ cd b", "$ ls", "50 c"]
+    part_one_result = part_one(tiny)
+    assert part_one_result == 200, part_one_result
     puzzle = Path("day07.txt").read_text().splitlines()
     print(part_one(puzzle=puzzle))
     part_two_result = part_two(TEST_INPUT)
     assert part_two_result == 24933642, part_two_result
+    # ... and when only deleting everything frees enough space
+    part_two_result = part_two(["$ cd /", "$ ls", "45000000 a", *tiny[3:]])
+    assert part_two_result == 45000050, part_two_result
     print(part_two(puzzle=puzzle))
 
 
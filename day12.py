@@ -3,8 +3,8 @@
 from pathlib import Path
 from collections import defaultdict
 
-import networkx
-from networkx.exception import NetworkXNoPath
+from graphs import Graph, NoPath, UNREACHABLE
+from parse_cache import cached
 
 
 TEST_INPUT = """Sabqponm
@@ -55,12 +55,11 @@ class Colors:
         lightgrey = "\033[47m"
 
 
+@cached
 def parse_input(
     puzzle: list[str],
-) -> tuple[
-    networkx.DiGraph, COORDINATE_TYPE, COORDINATE_TYPE, dict[COORDINATE_TYPE, int]
-]:
-    graph = networkx.DiGraph()
+) -> tuple[Graph, COORDINATE_TYPE, COORDINATE_TYPE, dict[COORDINATE_TYPE, int]]:
+    graph = Graph(directed=True)
 
     coordinates: dict[COORDINATE_TYPE, int] = {}
 
@@ -86,20 +85,17 @@ def parse_input(
 
 def part_one(puzzle: list[str]) -> int:
     graph, start, end, _ = parse_input(puzzle=puzzle)
-    return networkx.shortest_path_length(graph, start, end)
+    return graph.shortest_path_length(start, end)
 
 
 def part_two(puzzle: list[str]) -> int:
     graph, _, end, coordinates = parse_input(puzzle=puzzle)
-    minimum = 100000
-    for start, elev in coordinates.items():
-        if elev == 0:
-            try:
-                new_min = networkx.shortest_path_length(graph, start, end)
-            except NetworkXNoPath:
-                continue
-            minimum = min(new_min, minimum)
-    return minimum
+    # one BFS starting from every low point at once finds the closest of them
+    low_points = [start for start, elev in coordinates.items() if elev == 0]
+    distance = graph.bfs(low_points)[graph.index[end]]
+    if distance == UNREACHABLE:
+        raise NoPath(f"no low point can reach {end}")
+    return distance
 
 
 def visualize_part_two(puzzle: list[str]) -> None:
@@ -108,10 +104,8 @@ def visualize_part_two(puzzle: list[str]) -> None:
     for start, elev in coordinates.items():
         if elev == 0:
             try:
-                path_to_end: list[COORDINATE_TYPE] = networkx.shortest_path(
-                    graph, start, end
-                )
-            except NetworkXNoPath:
+                path_to_end: list[COORDINATE_TYPE] = graph.shortest_path(start, end)
+            except NoPath:
                 continue
             for point in path_to_end:
                 points_seen[point] += 1
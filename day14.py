@@ -4,6 +4,8 @@ import sys
 from pathlib import Path
 from time import sleep
 
+from grids import Grid
+
 TEST_INPUT = """498,4 -> 498,6 -> 496,6
 503,4 -> 502,4 -> 502,9 -> 494,9""".splitlines()
 
@@ -11,6 +13,11 @@ TEST_INPUT = """498,4 -> 498,6 -> 496,6
 START = 500, 0
 COORDINATE_TYPE = tuple[int, int]
 
+AIR = 0
+ROCK = ord("#")
+SAND = ord("o")
+SHOW = bytes.maketrans(bytes([AIR]), b" ")
+
 
 def parse_input(puzzle: list[str]) -> set(COORDINATE_TYPE):
     last_coordinate = 0, 0
@@ -35,31 +42,45 @@ def parse_input(puzzle: list[str]) -> set(COORDINATE_TYPE):
     return coordinates
 
 
-def drop_sand(
-    grid: set(COORDINATE_TYPE), starting_coordinate: COORDINATE_TYPE = START
-) -> COORDINATE_TYPE:
-    """Drop a grain of sand"""
-    the_bottom = max(y for _, y in grid) + 1
-    x, y = starting_coordinate
-    while y < the_bottom:
-        if (x, y + 1) not in grid:
+def build_cave(rocks: set(COORDINATE_TYPE)) -> tuple[Grid, int]:
+    """The scan as a grid with room for part two's floor, and the x it starts at
+
+    The floor is two below the lowest rock, and sand can only move one column
+    sideways for every row it falls, so none of it gets further than that
+    from where it's poured in.
+    """
+    floor = max(y for _, y in rocks) + 2
+    min_x = min(START[0] - floor, *(x for x, _ in rocks)) - 1
+    max_x = max(START[0] + floor, *(x for x, _ in rocks)) + 1
+    cave = Grid(max_x - min_x + 1, floor + 1, fill=AIR)
+    for x, y in rocks:
+        cave[x - min_x, y] = ROCK
+    return cave, min_x
+
+
+def drop_sand(cave: Grid, start: int, the_bottom: int) -> int:
+    """Drop a grain of sand from flat index `start` and return where it stops
+
+    Falling past row `the_bottom` means it's fallen past everything.
+    """
+    width = cave.width
+    cells = cave.cells
+    limit = the_bottom * width
+    index = start
+    while index < limit:
+        below = index + width
+        if not cells[below]:
             # keep going until we hit something
-            y += 1
-            continue
-        # ok, we've hit something
-        if (x - 1, y + 1) not in grid:
-            # can we move left?
-            x -= 1
-            y += 1
-            continue
-        # can we move right?
-        if (x + 1, y + 1) not in grid:
-            # yes
-            x += 1
-            y += 1
-            continue
-        # nope, can't move at all
-        return x, y
+            index = below
+        elif not cells[below - 1]:
+            # ok, we've hit something; can we move left?
+            index = below - 1
+        elif not cells[below + 1]:
+            # can we move right?
+            index = below + 1
+        else:
+            # nope, can't move at all
+            return index
     # AAAAAAAAAH!
     raise IntoTheAbyss()
 
@@ -67,60 +88,41 @@ def drop_sand(
 def part_two(puzzle: list[str], visualize: bool = False) -> int:
     """Same as part one, only now there's an infinite floor two levels below our last scan"""
     grains = 0
-    grid = parse_input(puzzle=puzzle)
-    the_bottom = max(y for _, y in grid) + 2
-    x_values = sorted(x for x, _ in grid)
-    # if we spread out an extra 300 in each dimension from our widest point
-    # that should more than cover it
-
-    # I had tried 3 for the test input but that wasn't enough, then I tried
-    # 30 and that was enough for the test input but not the real input
-    # after running it, the grid only went out to about 330 on the left and 675
-    # on the right
-    min_x = x_values[0] - 175
-    max_x = x_values[-1] + 175
-    grid |= {(dx, the_bottom) for dx in range(min_x, max_x)}
-    if visualize:
-        visualized = {coordinate: "#" for coordinate in grid}
+    cave, min_x = build_cave(parse_input(puzzle=puzzle))
+    floor = cave.height - 1
+    cave.cells[floor * cave.width :] = bytes([ROCK]) * cave.width
+    start = cave.index(START[0] - min_x, START[1])
     while True:
-        new_point = drop_sand(grid)
+        new_point = drop_sand(cave, start, floor)
         grains += 1
-        if new_point == START:
-            # print('blocked!')
+        cave.cells[new_point] = SAND
+        if new_point == start:
             if visualize:
-                display_grid(visualized, START[0] - 175, START[0] + 175)
+                display_grid(cave)
             return grains
-        # print(f'drop number {grains} landed at {new_point}')
-        grid.add(new_point)
-        if visualize:
-            visualized[new_point] = "o"
-            if not grains % 100:
-                display_grid(visualized, START[0] - 175, START[0] + 175)
+        if visualize and not grains % 100:
+            display_grid(cave)
 
 
-def display_grid(grid: dict[COORDINATE_TYPE, str], min_x: int, max_x: int):
-    min_y = 0
-    max_y = max(i[1] for i in grid)
+def display_grid(cave: Grid):
     # move to top left and clear screen
     print(chr(27) + "[2j")
     print("\033c")
     print("\x1bc")
-    for y in range(min_y, max_y + 2):
-
-        for x in range(min_x, max_x + 1):
-            print(grid.get((x, y), " "), end="")
-        print("")
+    for row in cave.rows():
+        print(row.translate(SHOW).decode())
 
 
 def part_one(puzzle: list[str]) -> int:
     grains = 0
-    grid = parse_input(puzzle=puzzle)
+    rocks = parse_input(puzzle=puzzle)
+    cave, min_x = build_cave(rocks)
+    start = cave.index(START[0] - min_x, START[1])
+    the_bottom = max(y for _, y in rocks) + 1
     try:
         while True:
-            new_point = drop_sand(grid)
+            cave.cells[drop_sand(cave, start, the_bottom)] = SAND
             grains += 1
-            # print(f'drop number {grains} landed at {new_point}')
-            grid.add(new_point)
     except IntoTheAbyss:
         return grains
 
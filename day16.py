@@ -6,7 +6,10 @@ from copy import deepcopy
 from collections import deque
 from typing import Self
 
-import networkx
+import profiling
+import progress
+from graphs import Graph
+from parse_cache import cached
 
 TURNS = 30
 
@@ -28,8 +31,9 @@ START_FLOW = 0
 Valve = tuple[bool, int, list[str]]
 
 
-def parse_input(puzzle: list[str]) -> tuple[dict[str, Valve], networkx.Graph]:
-    graph = networkx.Graph()
+@cached
+def parse_input(puzzle: list[str]) -> tuple[dict[str, Valve], Graph]:
+    graph = Graph()
     valves: dict[str, Valve] = {}
     for line in puzzle:
         words = line.split()
@@ -63,19 +67,16 @@ def part_one(puzzle: list[str]) -> int:
         for name, (valve_open, rate, _) in valves.items()
         if rate and not valve_open
     ]
-    for valve in valves:
-        distances[valve] = {}
-        for target in valves_to_open:
-            if target == valve:
-                continue
-            distances[valve][target] = networkx.shortest_path_length(
-                graph, valve, target
-            )
+    for valve, reachable in graph.all_pairs_distances(valves).items():
+        distances[valve] = {
+            target: reachable[target] for target in valves_to_open if target != valve
+        }
     queue: deque[tuple[int, int, str, dict[str, Valve]]] = deque(
         [(0, TURNS, "AA", deepcopy(valves))]
     )
     # queue: total flow, turns remaining, current position, valves
     best_flow = 0
+    stats = profiling.counters("day16.part_one")
     while True:
         try:
             (
@@ -86,6 +87,8 @@ def part_one(puzzle: list[str]) -> int:
             ) = queue.pop()
         except IndexError:
             return best_flow
+        if stats:
+            stats.expanded += 1
         open_valves = []
         total_flow_this_turn = 0
         for name, (flow_open, flow_rate, _) in current_valves.items():
@@ -112,6 +115,8 @@ def part_one(puzzle: list[str]) -> int:
             < best_flow
         ):
             # bail out if there's no way we could make it work
+            if stats:
+                stats.pruned += 1
             continue
         # try turning on the valve
         current_valve = current_valves[current_position]
@@ -138,6 +143,8 @@ def part_one(puzzle: list[str]) -> int:
                 queue.append(
                     (total_flow, turns_remaining - distance, target, current_valves)
                 )
+        if stats:
+            stats.saw_queue(len(queue))
 
 
 def open_or_move(
@@ -287,14 +294,10 @@ def part_two(puzzle: list[str]) -> int:
         for name, (valve_open, rate, _) in valves.items()
         if rate and not valve_open
     ]
-    for valve in valves:
-        distances[valve] = {}
-        for target in valves_to_open:
-            if target == valve:
-                continue
-            distances[valve][target] = networkx.shortest_path_length(
-                graph, valve, target
-            )
+    for valve, reachable in graph.all_pairs_distances(valves).items():
+        distances[valve] = {
+            target: reachable[target] for target in valves_to_open if target != valve
+        }
     queue: deque[State] = deque(
         [
             State(
@@ -311,14 +314,18 @@ def part_two(puzzle: list[str]) -> int:
     )
     best_flow = 0
     turns = 0
+    report = progress.reporter()
+    stats = profiling.counters("day16.part_two")
     while True:
         try:
             # eliminate the late-stage games first in the hopes
             # of getting cutoffs faster
             state = queue.pop()
         except IndexError:
-            if puzzle != TEST_INPUT:
-                print("\n")
+            if report:
+                report.done()
+            if stats:
+                stats.note(turns=turns)
             return best_flow
 
         if state.turns_remaining <= 0:
@@ -340,15 +347,17 @@ def part_two(puzzle: list[str]) -> int:
             < best_flow
         ):
             # bail out if there's no way we could make it work
+            if stats:
+                stats.pruned += 1
             continue
         queue.extend(state.take_action())
         turns += 1
+        if stats:
+            stats.expanded += 1
+            stats.saw_queue(len(queue))
 
-        if puzzle != TEST_INPUT and not turns % 10000:
-            print(
-                f"{turns=}\t{len(queue)=}\t{best_flow=}",
-                end="\r",
-            )
+        if report:
+            report(turns=turns, queue=len(queue), best_flow=best_flow)
 
 
 def main():
@@ -2,8 +2,8 @@
 
 from pathlib import Path
 
-import networkx
-from networkx.exception import NetworkXNoPath
+from graphs import Graph
+from parse_cache import cached
 
 COORDINATE_TYPE = tuple[int, int, int]
 
@@ -25,6 +25,7 @@ TEST_INPUT = """2,2,2
 2,3,5""".splitlines()
 
 
+@cached
 def parse_input(puzzle: list[str]) -> list[COORDINATE_TYPE]:
     grid = []
     for line in puzzle:
@@ -61,10 +62,9 @@ def part_one(puzzle: list[str]) -> int:
 
 def part_two(puzzle: list[str]) -> int:
     grid = set(parse_input(puzzle))
-    # abuse networkx here:
     # find all nodes which aren't in the graph and aren't reachable
     # from the outside world
-    graph = networkx.Graph()
+    graph = Graph()
     max_x = max(i[0] for i in grid) + 1
     max_y = max(i[1] for i in grid) + 1
     max_z = max(i[2] for i in grid) + 1
@@ -84,14 +84,11 @@ def part_two(puzzle: list[str]) -> int:
                     ]:
                         if neighbor not in grid:
                             graph.add_edge((x, y, z), neighbor)
-    internal_disconnected_bits: set[COORDINATE_TYPE] = set()
-    for x, y, z in graph.nodes:
-        if (x, y, z) == (-1, -1, -1):
-            continue
-        try:
-            networkx.shortest_path_length(graph, (x, y, z), (-1, -1, -1))
-        except NetworkXNoPath:
-            internal_disconnected_bits.add((x, y, z))
+    # a single flood fill from the corner finds everything outside
+    outside = graph.distances_from((-1, -1, -1))
+    internal_disconnected_bits: set[COORDINATE_TYPE] = {
+        node for node in graph.nodes if node not in outside
+    }
     # then pass that result into the same surface area function from part 1
     return part_one_score - unconnected_sides(internal_disconnected_bits)
 
@@ -4,6 +4,8 @@ from typing import Self
 from collections import defaultdict
 import heapq
 
+import profiling
+import progress
 
 TEST_INPUT = """Blueprint 1: Each ore robot costs 4 ore. Each clay robot costs 2 ore. Each obsidian robot costs 3 ore and 14 clay. Each geode robot costs 2 ore and 7 obsidian.
 Blueprint 2: Each ore robot costs 2 ore. Each clay robot costs 3 ore. Each obsidian robot costs 3 ore and 8 clay. Each geode robot costs 3 ore and 12 obsidian.""".splitlines()
@@ -83,11 +85,22 @@ def best_score_for_blueprint(blueprint: Blueprint, time: int = 24) -> int:
     result = 0
     counter = 0
     states = defaultdict(lambda: -100)
+    report = progress.reporter()
+    stats = profiling.counters("day19.best_score_for_blueprint")
     while queue:
         _, time_left, materials, robots = heapq.heappop(queue)
         counter += 1
-        if not counter % 100000:
-            print(counter, time_left, materials, robots, len(queue), end="\r")
+        if stats:
+            stats.expanded += 1
+            stats.saw_queue(len(queue) + 1)
+        if report:
+            report(
+                counter=counter,
+                time_left=time_left,
+                materials=materials,
+                robots=robots,
+                queue=len(queue),
+            )
         # how many geodes can we make given the current state?
         result = max(result, materials[-1] + robots[-1] * time_left)
         # how many can we make if we make a geode bot for every remaining turn
@@ -99,12 +112,16 @@ def best_score_for_blueprint(blueprint: Blueprint, time: int = 24) -> int:
         )
         if max_theoretical_limit <= result:
             # we've already done better
+            if stats:
+                stats.pruned += 1
             continue
 
         # use the geodes produced as the cache value
         cache_key = time_left, materials[:-1], robots
         if states[cache_key] >= materials[-1]:
             # have we already found a better way?
+            if stats:
+                stats.cache_hits += 1
             continue
         else:
             states[cache_key] = materials[-1]
@@ -181,7 +198,10 @@ def best_score_for_blueprint(blueprint: Blueprint, time: int = 24) -> int:
                         new_robots,
                     ),
                 )
-    print("")
+    if report:
+        report.done()
+    if stats:
+        stats.note(counter=counter)
     return result
 
 
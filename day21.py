@@ -2,6 +2,9 @@ from pathlib import Path
 from collections import deque
 from math import log10
 
+import profiling
+import progress
+
 TEST_INPUT = """root: pppw + sjmn
 dbpl: 5
 cczh: sllz + lgvd
@@ -107,6 +110,8 @@ def part_two(puzzle: list[str]) -> int:
     last_value = None
     last_values = deque([], maxlen=10)
     in_infinite_loop = False
+    report = progress.reporter()
+    stats = profiling.counters("day21.part_two")
     while True:
         real_value = eval(expr)
         try:
@@ -115,7 +120,10 @@ def part_two(puzzle: list[str]) -> int:
             pass
         else:
             if real_value == target:
-                print("\n")
+                if report:
+                    report.done()
+                if stats:
+                    stats.note(turns=turns)
                 return humn
         difference = target - real_value
 
@@ -151,6 +159,8 @@ def part_two(puzzle: list[str]) -> int:
         last_value = real_value
         last_values.appendleft(humn)
         turns += 1
+        if stats:
+            stats.expanded += 1
         if turns > 500000 and len(set(last_values)) < 500000:
             if not in_infinite_loop:
                 print(f"\ninfinite loop detected at {turns}")
@@ -159,10 +169,16 @@ def part_two(puzzle: list[str]) -> int:
             if in_infinite_loop:
                 print(f"\nloop cleared at {turns}")
             in_infinite_loop = False
-        if not turns % 1001:
-            print(
-                f"{turns=}\t{humn=}, {real_value=}, {last_value=}, {difference=}, {round(log10(abs(difference)))}, {last_values[0] - last_values[1]}, {in_infinite_loop=}",
-                end="\r",
+        if report:
+            report(
+                turns=turns,
+                humn=humn,
+                real_value=real_value,
+                last_value=last_value,
+                difference=difference,
+                magnitude=round(log10(abs(difference))) if difference else 0,
+                step=last_values[0] - last_values[1] if len(last_values) > 1 else 0,
+                in_infinite_loop=in_infinite_loop,
             )
 
 
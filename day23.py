@@ -2,6 +2,8 @@ from pathlib import Path
 from collections import deque, Counter
 from typing import Callable
 
+import progress
+
 
 SMALL_INPUT = """.....
 ..##.
@@ -129,9 +131,10 @@ def parse_input(puzzle: list[str]) -> GRID_TYPE:
 def part_one(puzzle: list[str], rounds: int = 10) -> int:
     grid = parse_input(puzzle)
     funcs = deque([propose_north, propose_south, propose_west, propose_east])
+    report = progress.reporter()
     for round in range(1, rounds + 1):
-        if rounds != 10:
-            print("new turn", round, end="\r")
+        if report:
+            report(round=round)
         proposed_moves = [(elf, move_elf(grid, elf, funcs=funcs)) for elf in grid]
         destinations = Counter(coordinate for _, coordinate in proposed_moves)
         new_grid: GRID_TYPE = set()
@@ -144,12 +147,16 @@ def part_one(puzzle: list[str], rounds: int = 10) -> int:
                 new_grid.add(elf)
         assert len(grid) == len(new_grid), new_grid
         if new_grid == grid:
+            if report:
+                report.done()
             print("found a dead stop!")
             return round
         grid = new_grid
         funcs.rotate(-1)
         # display_grid(new_grid)
 
+    if report:
+        report.done()
     return empty_tiles(grid)
 
 
@@ -1,6 +1,9 @@
 import heapq
 from pathlib import Path
 
+import profiling
+import progress
+from grids import Grid
 
 TEST_INPUT = """#.######
 #>>.<^<#
@@ -10,7 +13,11 @@ TEST_INPUT = """#.######
 ######.#""".splitlines()
 
 COORDINATE_TYPE = tuple[int, int]
-GRID_TYPE = dict[COORDINATE_TYPE, str]
+# every cell is a bit mask of the blizzards in it, or a wall
+GRID_TYPE = Grid
+
+WALL = 16
+EMPTY = 0
 
 DIRECTIONS = {
     ">": (1, 0),
@@ -19,13 +26,16 @@ DIRECTIONS = {
     "v": (0, 1),
 }
 
+BLIZZARDS = {char: 1 << bit for bit, char in enumerate(DIRECTIONS)}
+CELLS = {".": EMPTY, "#": WALL, **BLIZZARDS}
+BLIZZARD_MOVES = [(BLIZZARDS[char], delta) for char, delta in DIRECTIONS.items()]
+
 
 def parse_input(
     puzzle: list[str],
 ) -> tuple[GRID_TYPE, COORDINATE_TYPE, COORDINATE_TYPE]:
     start = None
     end = None
-    grid: GRID_TYPE = {}
     for y, row in enumerate(puzzle):
         for x, char in enumerate(row):
             if y == 0 and not start:
@@ -35,7 +45,7 @@ def parse_input(
             if y == len(puzzle) - 1 and not end:
                 if char == ".":
                     end = (x, y)
-            grid[x, y] = char
+    grid = Grid.from_lines(puzzle, cell=CELLS.__getitem__)
 
     return grid, start, end
 
@@ -43,64 +53,56 @@ def parse_input(
 def make_move(
     grid: GRID_TYPE, person: COORDINATE_TYPE, width: int, height: int
 ) -> list[tuple[GRID_TYPE, COORDINATE_TYPE]]:
-    assert grid[person] == ".", (grid, person)
+    assert grid[person] == EMPTY, (grid, person)
     results = []
-    new_grid: GRID_TYPE = {}
-    for (x, y), chars in grid.items():
-        if chars == ".":
+    new_grid = Grid(width, height)
+    cells = grid.cells
+    new_cells = new_grid.cells
+    for index, cell in enumerate(cells):
+        if cell == EMPTY:
             # nothing leaves this place
             continue
-        elif chars == "#":
-            new_grid[x, y] = chars
+        elif cell == WALL:
+            new_cells[index] = WALL
             continue
-        for char in chars:
-            dx, dy = DIRECTIONS[char]
-            if grid[x + dx, y + dy] == "#":
+        y, x = divmod(index, width)
+        for blizzard, (dx, dy) in BLIZZARD_MOVES:
+            if not cell & blizzard:
+                continue
+            new_x = x + dx
+            new_y = y + dy
+            if cells[new_y * width + new_x] == WALL:
                 # warp!
                 if dx == -1:
                     # left wall
-                    save_to_grid(new_grid, width - 2, y, char)
+                    new_x = width - 2
                 elif dx == 1:
                     # right wall
-                    save_to_grid(new_grid, 1, y, char)
+                    new_x = 1
                 elif dy == -1:
                     # top wall
-                    save_to_grid(new_grid, x, height - 2, char)
+                    new_y = height - 2
                 else:
                     assert dy == 1, (dx, dy)
-                    save_to_grid(new_grid, x, 1, char)
-            else:
-                save_to_grid(new_grid, x + dx, y + dy, char)
-    # print(new_grid)
-    # now let's put our dots in
-    for x in range(width):
-        for y in range(height):
-            if (x, y) not in new_grid:
-                new_grid[x, y] = "."
-    if new_grid[person] == ".":
+                    new_y = 1
+            new_cells[new_y * width + new_x] |= blizzard
+    # nobody changes a grid once it's been made, so every move can share it
+    if new_grid[person] == EMPTY:
         # not moving is valid
         # print(f'not moving from {person} is valid')
-        results.append((new_grid.copy(), person))
+        results.append((new_grid, person))
     x, y = person
     for dx, dy in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
-        if (dx, dy) not in grid:
+        if not grid.in_bounds(dx, dy):
             continue
-        if new_grid[dx, dy] != ".":
+        if new_grid[dx, dy] != EMPTY:
             continue
         # print(f'moving from {person} to {(dx, dy)} is valid')
         # this move is valid
-        results.append((new_grid.copy(), (dx, dy)))
+        results.append((new_grid, (dx, dy)))
     return results
 
 
-def save_to_grid(grid: GRID_TYPE, x: int, y: int, char: str):
-    assert len(char) == 1
-    try:
-        grid[x, y] += char
-    except KeyError:
-        grid[x, y] = char
-
-
 def part_one(puzzle: list[str]) -> int:
     best_turns = 750
     grid, start, end = parse_input(puzzle)
@@ -117,6 +119,8 @@ def part_one(puzzle: list[str]) -> int:
     # )
     # print('trying to get to ', end)
     states_seen: set[tuple[int, COORDINATE_TYPE]] = set()
+    report = progress.reporter()
+    stats = profiling.counters("day24.part_one")
     while queue:
         try:
             turns, position, new_grid = heapq.heappop(queue)
@@ -127,9 +131,13 @@ def part_one(puzzle: list[str]) -> int:
             best_turns = min(best_turns, turns)
             continue
         if turns >= best_turns:
+            if stats:
+                stats.pruned += 1
             continue
         set_key = (turns, position)
         if set_key in states_seen:
+            if stats:
+                stats.cache_hits += 1
             continue
         states_seen.add(set_key)
         for newer_grid, new_position in make_move(
@@ -139,8 +147,20 @@ def part_one(puzzle: list[str]) -> int:
             # display_grid(newer_grid, position)
             heapq.heappush(queue, (turns + 1, new_position, newer_grid))
         iterations += 1
-        print(f"{iterations}\t{len(queue)}\t{turns}\t{best_turns}", end="\r")
-    print("")
+        if stats:
+            stats.expanded += 1
+            stats.saw_queue(len(queue))
+        if report:
+            report(
+                iterations=iterations,
+                queue=len(queue),
+                turns=turns,
+                best_turns=best_turns,
+            )
+    if report:
+        report.done()
+    if stats:
+        stats.note(iterations=iterations)
     return best_turns
 
 
@@ -162,6 +182,8 @@ def part_two(puzzle: list[str], part_one_score: int) -> int:
     # )
     # print('trying to get to ', end)
     states_seen: set[tuple[int, COORDINATE_TYPE]] = set()
+    report = progress.reporter()
+    stats = profiling.counters("day24.part_two")
     while queue:
         try:
             turns, position, new_grid = heapq.heappop(queue)
@@ -172,9 +194,13 @@ def part_two(puzzle: list[str], part_one_score: int) -> int:
             best_turns = min(best_turns, turns)
             continue
         if turns >= best_turns:
+            if stats:
+                stats.pruned += 1
             continue
         set_key = (turns, position)
         if set_key in states_seen:
+            if stats:
+                stats.cache_hits += 1
             continue
         states_seen.add(set_key)
         for newer_grid, new_position in make_move(
@@ -184,23 +210,35 @@ def part_two(puzzle: list[str], part_one_score: int) -> int:
             # display_grid(newer_grid, position)
             heapq.heappush(queue, (turns + 1, new_position, newer_grid))
         iterations += 1
-        print(f"{iterations}\t{len(queue)}\t{turns}\t{best_turns}", end="\r")
-    print("")
+        if stats:
+            stats.expanded += 1
+            stats.saw_queue(len(queue))
+        if report:
+            report(
+                iterations=iterations,
+                queue=len(queue),
+                turns=turns,
+                best_turns=best_turns,
+            )
+    if report:
+        report.done()
+    if stats:
+        stats.note(iterations=iterations)
     return best_turns
 
 
 def display_grid(grid: GRID_TYPE, person: COORDINATE_TYPE):
-    max_x = max(x for x, _ in grid)
-    max_y = max(y for _, y in grid)
-    for y in range(max_y + 1):
-        for x in range(max_x + 1):
+    chars = {value: char for char, value in CELLS.items()}
+    for y in range(grid.height):
+        for x in range(grid.width):
+            cell = grid[x, y]
             if (x, y) == person:
                 print("P", end="")
 
-            elif (length := len(grid[x, y])) > 1:
+            elif (length := cell.bit_count()) > 1 and cell != WALL:
                 print(length, end="")
             else:
-                print(grid[x, y], end="")
+                print(chars[cell], end="")
         print("")
 
 
@@ -1,7 +1,10 @@
 """Day 25: SNAFU"""
 
+from collections.abc import Iterable
 from pathlib import Path
 
+from mapped_input import lines
+
 DECODES = {"2": 2, "1": 1, "0": 0, "-": -1, "=": -2}
 
 
@@ -77,7 +80,7 @@ def run_tests():
         )
 
 
-def part_one(puzzle: list[str]) -> str:
+def part_one(puzzle: Iterable[str]) -> str:
     value = 0
     for line in puzzle:
         value += decode_snafu(line)
@@ -88,8 +91,7 @@ def part_one(puzzle: list[str]) -> str:
 def main():
     part_one_result = part_one(TEST_INPUT)
     assert part_one_result == "2=-1=0", part_one_result
-    puzzle = Path("day25.txt").read_text().splitlines()
-    print(part_one(puzzle))
+    print(part_one(lines(Path("day25.txt"))))
 
 
 if __name__ == "__main__":
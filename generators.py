@@ -0,0 +1,568 @@
+"""Synthetic puzzle inputs of any size, for seeing how each day scales
+
+Every day has a generator taking a `size` and a `seed` and returning the text
+of a valid dayXX.txt. The same size and seed always give the same input. What
+`size` counts is different for every day and is spelled out in each
+generator's docstring.
+
+    python generators.py 1 20 --size 100000 --output-dir /tmp/big
+"""
+
+import argparse
+import math
+import random
+from collections.abc import Callable
+from pathlib import Path
+from string import ascii_letters, ascii_lowercase, ascii_uppercase
+
+from day25 import encode_snafu
+
+
+def day01(size: int, seed: int = 0) -> str:
+    """`size` elves, each carrying 1-10 snacks"""
+    rng = random.Random(seed)
+    elves = []
+    for _ in range(size):
+        elves.append(
+            "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 10)))
+        )
+    return "\n\n".join(elves) + "\n"
+
+
+def day02(size: int, seed: int = 0) -> str:
+    """`size` rounds"""
+    rng = random.Random(seed)
+    return "".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(size))
+
+
+def day03(size: int, seed: int = 0) -> str:
+    """`size` groups of three rucksacks"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        letters = list(ascii_letters)
+        rng.shuffle(letters)
+        badge = letters[0]
+        # every elf in the group gets their own letters, so the badge is the
+        # only thing they all have in common
+        for pool in (letters[1:18], letters[18:35], letters[35:52]):
+            shared = pool[0]
+            half = rng.randint(3, 16)
+            left = [shared] + rng.choices(pool[1:9], k=half - 1)
+            right = [shared] + rng.choices(pool[9:17], k=half - 1)
+            (left if rng.random() < 0.5 else right)[-1] = badge
+            rng.shuffle(left)
+            rng.shuffle(right)
+            lines.append("".join(left + right))
+    return "\n".join(lines) + "\n"
+
+
+def day04(size: int, seed: int = 0) -> str:
+    """`size` pairs of section assignments"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        start1, end1 = sorted(rng.randint(1, 99) for _ in range(2))
+        start2, end2 = sorted(rng.randint(1, 99) for _ in range(2))
+        lines.append(f"{start1}-{end1},{start2}-{end2}")
+    return "\n".join(lines) + "\n"
+
+
+def day05(size: int, seed: int = 0) -> str:
+    """Nine stacks and `size` moves (stacks get taller as `size` grows)"""
+    rng = random.Random(seed)
+    stacks = 9
+    tallest = max(8, size // 100)
+    crates = [
+        [rng.choice(ascii_uppercase) for _ in range(rng.randint(1, tallest))]
+        for _ in range(stacks)
+    ]
+    lines = []
+    for level in range(max(len(crate) for crate in crates) - 1, -1, -1):
+        lines.append(
+            " ".join(
+                f"[{crate[level]}]" if level < len(crate) else "   " for crate in crates
+            )
+        )
+    lines.append(" " + "   ".join(str(i) for i in range(1, stacks + 1)) + " ")
+    lines.append("")
+    heights = [len(crate) for crate in crates]
+    for _ in range(size):
+        source = rng.choice([index for index, height in enumerate(heights) if height])
+        target = rng.choice([index for index in range(stacks) if index != source])
+        qty = rng.randint(1, min(heights[source], 30))
+        heights[source] -= qty
+        heights[target] += qty
+        lines.append(f"move {qty} from {source + 1} to {target + 1}")
+    return "\n".join(lines) + "\n"
+
+
+def day06(size: int, seed: int = 0) -> str:
+    """A `size`-character signal whose markers only show up at the very end"""
+    rng = random.Random(seed)
+    # three letters can never make a four letter marker
+    body = "".join(rng.choice("abc") for _ in range(max(size - 14, 0)))
+    return body + "defghijklmnopq\n"
+
+
+def _name(number: int, alphabet: str = ascii_lowercase) -> str:
+    """A unique all-letter name for `number`"""
+    name = ""
+    while True:
+        number, digit = divmod(number, len(alphabet))
+        name += alphabet[digit]
+        if not number:
+            return name
+
+
+def day07(size: int, seed: int = 0) -> str:
+    """A terminal session exploring `size` directories
+
+    File sizes are scaled so the whole disk holds about 45,000,000, like the
+    real thing, so part two always has something to delete.
+    """
+    rng = random.Random(seed)
+    # two files per directory on average
+    biggest_file = max(2 * 45_000_000 // (2 * size), 1)
+    children: list[list[int]] = [[] for _ in range(size)]
+    for directory in range(1, size):
+        children[rng.randrange(directory)].append(directory)
+    lines = ["$ cd /"]
+    # None on the stack means it's time to head back up
+    stack: list[int | None] = [0]
+    while stack:
+        directory = stack.pop()
+        if directory is None:
+            lines.append("$ cd ..")
+            continue
+        if directory:
+            lines.append(f"$ cd {_name(directory)}")
+        lines.append("$ ls")
+        for child in children[directory]:
+            lines.append(f"dir {_name(child)}")
+        for file_number in range(rng.randint(0, 4)):
+            lines.append(
+                f"{rng.randint(1, biggest_file)} f{file_number}.{_name(directory)}"
+            )
+        if directory:
+            stack.append(None)
+        stack.extend(reversed(children[directory]))
+    return "\n".join(lines) + "\n"
+
+
+def day08(size: int, seed: int = 0) -> str:
+    """A `size` x `size` forest"""
+    rng = random.Random(seed)
+    return "".join(
+        "".join(rng.choice("0123456789") for _ in range(size)) + "\n"
+        for _ in range(size)
+    )
+
+
+def day09(size: int, seed: int = 0) -> str:
+    """`size` head moves"""
+    rng = random.Random(seed)
+    return "".join(f"{rng.choice('RLUD')} {rng.randint(1, 20)}\n" for _ in range(size))
+
+
+def day10(size: int, seed: int = 0) -> str:
+    """`size` instructions (at least enough to draw the whole screen)"""
+    rng = random.Random(seed)
+    lines = []
+    cycles = 0
+    while len(lines) < size or cycles < 240:
+        if rng.random() < 0.3:
+            lines.append("noop")
+            cycles += 1
+        else:
+            lines.append(f"addx {rng.randint(-10, 10) or 1}")
+            cycles += 2
+    return "\n".join(lines) + "\n"
+
+
+def _primes(count: int) -> list[int]:
+    primes: list[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def day11(size: int, seed: int = 0) -> str:
+    """`size` monkeys (at least 3)
+
+    Exactly one of them squares its worry, as in real inputs; part one never
+    takes a modulus, so any more and the numbers grow doubly exponentially.
+    """
+    rng = random.Random(seed)
+    size = max(size, 3)
+    primes = _primes(size)
+    rng.shuffle(primes)
+    squarer = rng.randrange(size)
+    monkeys = []
+    for number, prime in enumerate(primes):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 6)))
+        if number == squarer:
+            operation = "old * old"
+        else:
+            operation = rng.choice(
+                [f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"]
+            )
+        true_target, false_target = rng.sample(
+            [other for other in range(size) if other != number], 2
+        )
+        monkeys.append(
+            f"Monkey {number}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {prime}\n"
+            f"    If true: throw to monkey {true_target}\n"
+            f"    If false: throw to monkey {false_target}"
+        )
+    return "\n\n".join(monkeys) + "\n"
+
+
+def day12(size: int, seed: int = 0) -> str:
+    """A hill `size` squares wide (at least 26) and a quarter as tall"""
+    rng = random.Random(seed)
+    width = max(size, 26)
+    height = max(size // 4, 5)
+    middle = height // 2
+    rows = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            elevation = x * 25 // (width - 1)
+            # leave the middle row smooth so there's always a way up
+            if y != middle:
+                elevation = max(elevation - rng.choice([0, 0, 1, 2]), 0)
+            row.append(ascii_lowercase[elevation])
+        rows.append(row)
+    rows[middle][0] = "S"
+    rows[middle][-1] = "E"
+    return "".join("".join(row) + "\n" for row in rows)
+
+
+def _packet(rng: random.Random, depth: int = 0) -> str:
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(_packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return f"[{','.join(items)}]"
+
+
+def day13(size: int, seed: int = 0) -> str:
+    """`size` pairs of packets"""
+    rng = random.Random(seed)
+    return "\n\n".join(f"{_packet(rng)}\n{_packet(rng)}" for _ in range(size)) + "\n"
+
+
+def day14(size: int, seed: int = 0) -> str:
+    """`size` rock paths"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        x = rng.randint(470, 530)
+        y = rng.randint(10, 150)
+        points = [(x, y)]
+        for segment in range(rng.randint(1, 5)):
+            if segment % 2:
+                y = min(max(y + rng.randint(-10, 10), 1), 160)
+            else:
+                x = min(max(x + rng.randint(-10, 10), 440), 560)
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(lines) + "\n"
+
+
+def day15(size: int, seed: int = 0, bound: int = 4_000_000) -> str:
+    """`size` sensors besides the eight that hide the distress beacon
+
+    The distress beacon is somewhere near the middle of 0..`bound`. Four
+    sensors whose edges pass just beside it along each axis and four more on
+    its diagonals cover every other point in the square.
+    """
+    rng = random.Random(seed)
+    beacon_x = rng.randint(bound // 4, 3 * bound // 4)
+    beacon_y = rng.randint(bound // 4, 3 * bound // 4)
+    reach_x = max(beacon_x, bound - beacon_x)
+    reach_y = max(beacon_y, bound - beacon_y)
+    sensors = []
+    axis_range = reach_x + reach_y
+    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+        sensor = (
+            beacon_x + dx * (axis_range + 1),
+            beacon_y + dy * (axis_range + 1),
+        )
+        sensors.append((sensor, (sensor[0] + dx * axis_range, sensor[1])))
+    diagonal = max(reach_x, reach_y) + 1
+    for dx, dy in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+        sensor = beacon_x + dx * diagonal, beacon_y + dy * diagonal
+        sensors.append((sensor, (sensor[0] + dx * (2 * diagonal - 1), sensor[1])))
+    while len(sensors) < size + 8:
+        x = rng.randint(0, bound)
+        y = rng.randint(0, bound)
+        distance = abs(x - beacon_x) + abs(y - beacon_y)
+        if distance < 2:
+            continue
+        # never reach the distress beacon
+        reach = rng.randint(1, distance - 1)
+        dx = rng.randint(0, reach)
+        sensors.append(
+            (
+                (x, y),
+                (x + rng.choice((-1, 1)) * dx, y + rng.choice((-1, 1)) * (reach - dx)),
+            )
+        )
+    rng.shuffle(sensors)
+    return "".join(
+        f"Sensor at x={x}, y={y}: closest beacon is at x={bx}, y={by}\n"
+        for (x, y), (bx, by) in sensors
+    )
+
+
+def day16(size: int, seed: int = 0) -> str:
+    """`size` valves (at most 676), up to 15 of which have any flow"""
+    rng = random.Random(seed)
+    size = min(max(size, 2), 26 * 26)
+    names = ["AA"] + rng.sample(
+        [a + b for a in ascii_uppercase for b in ascii_uppercase if a + b != "AA"],
+        size - 1,
+    )
+    tunnels: dict[str, set[str]] = {name: set() for name in names}
+    for index, name in enumerate(names[1:], start=1):
+        other = names[rng.randrange(index)]
+        tunnels[name].add(other)
+        tunnels[other].add(name)
+    for _ in range(size // 4):
+        first, second = rng.sample(names, 2)
+        tunnels[first].add(second)
+        tunnels[second].add(first)
+    flowing = set(rng.sample(names[1:], min(15, size // 2)))
+    lines = []
+    for name in names:
+        rate = rng.randint(1, 25) if name in flowing else 0
+        neighbors = sorted(tunnels[name])
+        if len(neighbors) == 1:
+            tail = f"tunnel leads to valve {neighbors[0]}"
+        else:
+            tail = f"tunnels lead to valves {', '.join(neighbors)}"
+        lines.append(f"Valve {name} has flow rate={rate}; {tail}")
+    return "\n".join(lines) + "\n"
+
+
+def day17(size: int, seed: int = 0) -> str:
+    """`size` jets of hot gas"""
+    rng = random.Random(seed)
+    return "".join(rng.choice("<>") for _ in range(size)) + "\n"
+
+
+def day18(size: int, seed: int = 0) -> str:
+    """`size` lava cubes, packed into a box about a third full"""
+    rng = random.Random(seed)
+    side = math.ceil((size / 0.35) ** (1 / 3)) + 1
+    cubes: set[tuple[int, int, int]] = set()
+    while len(cubes) < size:
+        cubes.add(tuple(rng.randint(0, side) for _ in range(3)))
+    ordered = sorted(cubes)
+    rng.shuffle(ordered)
+    return "".join(f"{x},{y},{z}\n" for x, y, z in ordered)
+
+
+def day19(size: int, seed: int = 0) -> str:
+    """`size` blueprints"""
+    rng = random.Random(seed)
+    return "".join(
+        f"Blueprint {number}: Each ore robot costs {rng.randint(2, 4)} ore."
+        f" Each clay robot costs {rng.randint(2, 4)} ore."
+        f" Each obsidian robot costs {rng.randint(2, 4)} ore and"
+        f" {rng.randint(5, 20)} clay."
+        f" Each geode robot costs {rng.randint(2, 4)} ore and"
+        f" {rng.randint(5, 20)} obsidian.\n"
+        for number in range(1, size + 1)
+    )
+
+
+def day20(size: int, seed: int = 0) -> str:
+    """`size` numbers to mix, exactly one of them 0"""
+    rng = random.Random(seed)
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10000) for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return "".join(f"{number}\n" for number in numbers)
+
+
+def day21(size: int, seed: int = 0) -> str:
+    """`size` monkeys (at most 400,000) in one expression tree under root
+
+    Every monkey yells a positive number, divisions come out even, and humn
+    only shows up once, on root's left, which always gets smaller as humn
+    grows (part two's search counts on that). That search was tuned on the
+    author's own input, though, and can still give up on these.
+    """
+    rng = random.Random(seed)
+    size = min(max(size, 7), 400_000)
+    lines = []
+    names = iter(
+        rng.sample(
+            [
+                name
+                for name in (_name(number).ljust(4, "a") for number in range(26**4))
+                if name not in ("root", "humn")
+            ],
+            size,
+        )
+    )
+
+    def build(value: int, budget: int, human: bool) -> tuple[str, int]:
+        """Name of a monkey yelling `value`, and which way it moves with humn"""
+        # every operation needs itself and at least one monkey on each side
+        if budget < 3:
+            name = "humn" if human else next(names)
+            lines.append(f"{name}: {value}")
+            return name, int(human)
+        name = next(names)
+        operations = ["-", "/"]
+        if value >= 2:
+            operations.append("+")
+        if factors := [factor for factor in range(2, 10) if value % factor == 0]:
+            operations.append("*")
+        operation = rng.choice(operations)
+        small = rng.randint(1, 100)
+        if operation == "+":
+            left = rng.randint(1, value - 1)
+            right = value - left
+        elif operation == "-":
+            left, right = value + small, small
+        elif operation == "*":
+            right = rng.choice(factors)
+            left = value // right
+        else:
+            left, right = value * small, small
+        if operation in "+*" and rng.random() < 0.5:
+            # mix up which side the bigger number is on
+            left, right = right, left
+        left_budget = rng.randint(1, budget - 2)
+        # humn never ends up dividing anything
+        human_left = human and (operation == "/" or rng.random() < 0.5)
+        left_name, left_slope = build(left, left_budget, human_left)
+        right_name, right_slope = build(
+            right, budget - 1 - left_budget, human and not human_left
+        )
+        lines.append(f"{name}: {left_name} {operation} {right_name}")
+        if operation == "-":
+            return name, left_slope - right_slope
+        return name, left_slope + right_slope
+
+    root_value = rng.randint(1000, 100000)
+    left_value = rng.randint(2, root_value - 1)
+    human_value = rng.randint(1, left_value - 1)
+    human_budget = (size - 3) // 2
+    human_name, slope = build(human_value, human_budget, True)
+    # flip the human's side around if it would grow with humn
+    left_name = next(names)
+    constant_name = next(names)
+    if slope > 0:
+        lines.append(f"{constant_name}: {left_value + human_value}")
+        lines.append(f"{left_name}: {constant_name} - {human_name}")
+    else:
+        lines.append(f"{constant_name}: {left_value - human_value}")
+        lines.append(f"{left_name}: {human_name} + {constant_name}")
+    right_name, _ = build(root_value - left_value, size - 3 - human_budget, False)
+    lines.append(f"root: {left_name} + {right_name}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def day22(size: int, seed: int = 0) -> str:
+    """The usual 50x50-faced cube net and a path of `size` moves
+
+    Part two is tied to the layout of the author's own input (it checks a
+    handful of moves against known answers first), so only part one can run
+    on these.
+    """
+    rng = random.Random(seed)
+    face = 50
+    # which faces are filled in, by (face row, face column)
+    faces = {(0, 1), (0, 2), (1, 1), (2, 0), (2, 1), (3, 0)}
+    rows = []
+    for y in range(4 * face):
+        row = ""
+        for x in range(3 * face):
+            if (y // face, x // face) not in faces:
+                row += " "
+            else:
+                row += "#" if rng.random() < 0.08 else "."
+        rows.append(row.rstrip())
+    # the starting point always has to be open
+    rows[0] = " " * face + "." + rows[0][face + 1 :]
+    path = "".join(
+        f"{rng.randint(1, face)}{rng.choice('RL')}" for _ in range(size - 1)
+    ) + str(rng.randint(1, face))
+    return "\n".join(rows) + "\n\n" + path + "\n"
+
+
+def day23(size: int, seed: int = 0) -> str:
+    """A `size` x `size` field, about half of it elves"""
+    rng = random.Random(seed)
+    return "".join(
+        "".join("#" if rng.random() < 0.5 else "." for _ in range(size)) + "\n"
+        for _ in range(size)
+    )
+
+
+def day24(size: int, seed: int = 0) -> str:
+    """A valley `size` squares wide and a quarter as tall, walls included"""
+    rng = random.Random(seed)
+    width = max(size, 5)
+    height = max(size // 4, 5)
+    rows = ["#." + "#" * (width - 2)]
+    for _ in range(height - 2):
+        row = "#"
+        for x in range(1, width - 1):
+            choices = "<>" if x in (1, width - 2) else "<>^v"
+            # nothing blows up or down into the entrance or the exit
+            row += rng.choice(choices) if rng.random() < 0.5 else "."
+        rows.append(row + "#")
+    rows.append("#" * (width - 2) + ".#")
+    return "\n".join(rows) + "\n"
+
+
+def day25(size: int, seed: int = 0) -> str:
+    """`size` SNAFU numbers"""
+    rng = random.Random(seed)
+    return "".join(encode_snafu(rng.randint(1, 10**12)) + "\n" for _ in range(size))
+
+
+GENERATORS: dict[int, Callable[[int, int], str]] = {
+    day: globals()[f"day{day:02}"] for day in range(1, 26)
+}
+
+
+def write_inputs(days: list[int], size: int, seed: int, output_dir: Path):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for day in days:
+        (output_dir / f"day{day:02}.txt").write_text(GENERATORS[day](size, seed))
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=int,
+        default=list(GENERATORS),
+        help="days to generate (default all)",
+    )
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", type=Path, default=Path("generated"))
+    args = parser.parse_args(argv)
+    write_inputs(args.days, args.size, args.seed, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Small, dependency-free graphs for the days that only ever need BFS
+
+Nodes can be anything hashable. Each one is numbered as it's added, and the
+adjacency is a list of neighbor-number lists, so searches walk plain lists of
+ints instead of hashing coordinates or going through networkx's dict-of-dicts.
+
+If a day ever needs more than breadth-first search, `Graph.to_networkx()`
+builds the equivalent networkx graph. networkx is only imported then.
+"""
+
+from collections.abc import Hashable, Iterable
+
+UNREACHABLE = -1
+
+
+class NoPath(Exception):
+    """There's no way to get from the source to the target"""
+
+
+class Graph:
+    __slots__ = ("directed", "nodes", "index", "adjacency")
+
+    def __init__(self, directed: bool = False):
+        self.directed = directed
+        # node number -> node, node -> node number, node number -> neighbors
+        self.nodes: list[Hashable] = []
+        self.index: dict[Hashable, int] = {}
+        self.adjacency: list[list[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self.index
+
+    def add_node(self, node: Hashable) -> int:
+        try:
+            return self.index[node]
+        except KeyError:
+            number = self.index[node] = len(self.nodes)
+            self.nodes.append(node)
+            self.adjacency.append([])
+            return number
+
+    def add_edge(self, source: Hashable, target: Hashable):
+        source_number = self.add_node(source)
+        target_number = self.add_node(target)
+        # puzzle inputs tend to list every tunnel from both ends
+        if target_number not in self.adjacency[source_number]:
+            self.adjacency[source_number].append(target_number)
+        if not self.directed and source_number not in self.adjacency[target_number]:
+            self.adjacency[target_number].append(source_number)
+
+    def bfs(self, sources: Iterable[Hashable]) -> list[int]:
+        """Distance from the nearest source to every node, by node number
+
+        Nodes that can't be reached are UNREACHABLE.
+        """
+        distances = [UNREACHABLE] * len(self.nodes)
+        frontier = []
+        for source in sources:
+            number = self.index[source]
+            distances[number] = 0
+            frontier.append(number)
+        adjacency = self.adjacency
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for number in frontier:
+                for neighbor in adjacency[number]:
+                    if distances[neighbor] == UNREACHABLE:
+                        distances[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
+
+    def distances_from(self, *sources: Hashable) -> dict[Hashable, int]:
+        """Distance from the nearest of `sources` to every node we can reach"""
+        return {
+            self.nodes[number]: distance
+            for number, distance in enumerate(self.bfs(sources))
+            if distance != UNREACHABLE
+        }
+
+    def all_pairs_distances(
+        self, sources: Iterable[Hashable] | None = None
+    ) -> dict[Hashable, dict[Hashable, int]]:
+        """One BFS per source (default every node)"""
+        if sources is None:
+            sources = self.nodes
+        return {source: self.distances_from(source) for source in sources}
+
+    def _parents(self, source: int, target: int) -> list[int]:
+        """BFS from source until target turns up, remembering how we got there"""
+        parents = [UNREACHABLE] * len(self.nodes)
+        parents[source] = source
+        frontier = [source]
+        adjacency = self.adjacency
+        while frontier and parents[target] == UNREACHABLE:
+            next_frontier = []
+            for number in frontier:
+                for neighbor in adjacency[number]:
+                    if parents[neighbor] == UNREACHABLE:
+                        parents[neighbor] = number
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        if parents[target] == UNREACHABLE:
+            raise NoPath(f"no path from {self.nodes[source]} to {self.nodes[target]}")
+        return parents
+
+    def shortest_path(self, source: Hashable, target: Hashable) -> list[Hashable]:
+        source_number = self.index[source]
+        number = self.index[target]
+        parents = self._parents(source_number, number)
+        path = [number]
+        while number != source_number:
+            number = parents[number]
+            path.append(number)
+        return [self.nodes[number] for number in reversed(path)]
+
+    def shortest_path_length(self, source: Hashable, target: Hashable) -> int:
+        return len(self.shortest_path(source, target)) - 1
+
+    def to_networkx(self):
+        import networkx
+
+        graph = networkx.DiGraph() if self.directed else networkx.Graph()
+        graph.add_nodes_from(self.nodes)
+        graph.add_edges_from(
+            (self.nodes[number], self.nodes[neighbor])
+            for number, neighbors in enumerate(self.adjacency)
+            for neighbor in neighbors
+        )
+        return graph
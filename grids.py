@@ -0,0 +1,167 @@
+"""Flat, array-backed 2D grids
+
+Cells live row-major in a single bytearray (or an array.array for a wider
+typecode), so a cell is `cells[y * width + x]` and a neighbor is the current
+flat index plus a fixed offset. That's a lot cheaper than hashing a tuple or a
+complex for every lookup, and a 1000x1000 grid of bytes is a megabyte instead
+of a dict with a million boxed keys.
+
+`Grid.numpy()` gives a (height, width) NumPy view over the same memory for the
+days that want to vectorize. NumPy is only imported when that's called.
+"""
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from typing import Self
+
+Coordinate = tuple[int, int]
+
+ORTHOGONAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+ALL_NEIGHBORS = ORTHOGONAL + DIAGONAL
+
+
+class Grid:
+    __slots__ = ("width", "height", "wrap", "cells")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fill: int = 0,
+        wrap: bool = False,
+        typecode: str = "B",
+    ):
+        """`wrap` makes coordinates past an edge come back in on the other side"""
+        self.width = width
+        self.height = height
+        self.wrap = wrap
+        if typecode == "B":
+            self.cells: bytearray | array = bytearray([fill]) * (width * height)
+        else:
+            self.cells = array(typecode, [fill]) * (width * height)
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        cell: Callable[[str], int] = ord,
+        fill: int = 0,
+        **kwargs,
+    ) -> Self:
+        """Build a grid from puzzle rows, converting each character with `cell`
+
+        Rows shorter than the longest one are padded with `fill`.
+        """
+        rows = [[cell(char) for char in line] for line in lines]
+        grid = cls(
+            max((len(row) for row in rows), default=0), len(rows), fill, **kwargs
+        )
+        for y, row in enumerate(rows):
+            start = y * grid.width
+            grid.cells[start : start + len(row)] = grid._pack(row)
+        return grid
+
+    def _pack(self, values: list[int]) -> bytes | array:
+        if isinstance(self.cells, bytearray):
+            return bytes(values)
+        return array(self.cells.typecode, values)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.width == other.width and self.cells == other.cells
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(width={self.width}, height={self.height})"
+
+    def copy(self) -> Self:
+        new_grid = object.__new__(type(self))
+        new_grid.width = self.width
+        new_grid.height = self.height
+        new_grid.wrap = self.wrap
+        new_grid.cells = self.cells[:]
+        return new_grid
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        """Flat index of (x, y), wrapping or raising IndexError at the edges"""
+        if self.wrap:
+            return (y % self.height) * self.width + x % self.width
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError((x, y))
+        return y * self.width + x
+
+    def coordinate(self, index: int) -> Coordinate:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def __getitem__(self, coordinate: Coordinate) -> int:
+        return self.cells[self.index(*coordinate)]
+
+    def __setitem__(self, coordinate: Coordinate, value: int):
+        self.cells[self.index(*coordinate)] = value
+
+    def get(self, x: int, y: int, default: int | None = None) -> int | None:
+        if self.wrap or 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[self.index(x, y)]
+        return default
+
+    def offsets(self, directions: Iterable[Coordinate] = ORTHOGONAL) -> list[int]:
+        """Flat index offsets for each (dx, dy)
+
+        These ignore edges entirely, so either pad the grid with a border or
+        use `neighbors` when a step could run off the side.
+        """
+        return [dy * self.width + dx for dx, dy in directions]
+
+    def neighbors(
+        self, index: int, directions: Iterable[Coordinate] = ORTHOGONAL
+    ) -> Iterator[int]:
+        """Flat indices next to `index`, skipping (or wrapping) past the edges"""
+        y, x = divmod(index, self.width)
+        for dx, dy in directions:
+            new_x = x + dx
+            new_y = y + dy
+            if self.wrap:
+                yield (new_y % self.height) * self.width + new_x % self.width
+            elif 0 <= new_x < self.width and 0 <= new_y < self.height:
+                yield new_y * self.width + new_x
+
+    def row(self, y: int) -> bytearray | array:
+        return self.cells[y * self.width : (y + 1) * self.width]
+
+    def column(self, x: int) -> bytearray | array:
+        return self.cells[x :: self.width]
+
+    def rows(self) -> Iterator[bytearray | array]:
+        for y in range(self.height):
+            yield self.row(y)
+
+    def find(self, value: int) -> Iterator[int]:
+        """Flat index of every cell holding `value`"""
+        if isinstance(self.cells, bytearray):
+            index = self.cells.find(value)
+            while index != -1:
+                yield index
+                index = self.cells.find(value, index + 1)
+        else:
+            for index, cell in enumerate(self.cells):
+                if cell == value:
+                    yield index
+
+    def numpy(self):
+        """A (height, width) NumPy array sharing this grid's memory"""
+        import numpy
+
+        dtype = (
+            numpy.uint8 if isinstance(self.cells, bytearray) else self.cells.typecode
+        )
+        return numpy.frombuffer(self.cells, dtype=dtype).reshape(
+            self.height, self.width
+        )
@@ -0,0 +1,71 @@
+"""Lazy, memory-mapped puzzle input
+
+`Path.read_text().splitlines()` holds the whole file as a str plus a list of
+every line, which is about three times the file size. These readers mmap the
+file instead and hand out one line (or one blank-line-separated record) at a
+time, so a parser that only loops over its input runs in constant memory
+however big the file is: the OS pages the file in and out as we go.
+
+    from mapped_input import lines
+
+    elves = day01.parse_input(lines(Path("day01.txt")))
+
+Lines come out the way `splitlines()` would give them: no line endings, and no
+empty line for a trailing newline. The file stays mapped until the generator is
+exhausted or closed.
+"""
+
+import contextlib
+import mmap
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+
+@contextlib.contextmanager
+def mapped(path: Path | str) -> Iterator[mmap.mmap | bytes]:
+    """The file's bytes, mapped read-only"""
+    with open(path, "rb") as input_file:
+        # mmap refuses to map an empty file
+        if not os.fstat(input_file.fileno()).st_size:
+            yield b""
+            return
+        with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(data, "madvise"):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            yield data
+
+
+def byte_lines(path: Path | str) -> Iterator[bytes]:
+    """Each line as bytes, without its line ending"""
+    with mapped(path) as data:
+        start = 0
+        end = len(data)
+        while start < end:
+            newline = data.find(b"\n", start)
+            if newline == -1:
+                newline = end
+            line = data[start:newline]
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            yield line
+            start = newline + 1
+
+
+def lines(path: Path | str, encoding: str = "utf-8") -> Iterator[str]:
+    """Each line as a str, without its line ending"""
+    for line in byte_lines(path):
+        yield line.decode(encoding)
+
+
+def records(path: Path | str, encoding: str = "utf-8") -> Iterator[list[str]]:
+    """Runs of non-blank lines, split wherever there's a blank line"""
+    record = []
+    for line in lines(path, encoding):
+        if line.strip():
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
@@ -0,0 +1,176 @@
+"""Content-addressed cache for parsed puzzle inputs
+
+Parsers wrapped with `cached` only run once per distinct input: the result is
+kept in memory and, if a cache directory is configured (or AOC_PARSE_CACHE_DIR
+is set), pickled to disk so the next run can skip parsing entirely. Memory and
+disk each keep the most recently used `max_entries` parses and drop the rest,
+so a long-lived process (see `daemon`) doesn't grow with every new input.
+Keys cover the parser's module source as well as the input, so editing a day
+leaves its old pickles behind rather than loading them.
+
+Callers get the very same object back on every hit, so only wrap parsers whose
+output the solutions treat as read-only. Inputs that aren't a str or a list
+(say, lines streamed from `mapped_input`) can't be hashed without reading them
+up front, so those go straight to the parser.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 64
+
+_memory: OrderedDict[str, Any] = OrderedDict()
+_disk_dir: Path | None = (
+    Path(os.environ["AOC_PARSE_CACHE_DIR"])
+    if os.environ.get("AOC_PARSE_CACHE_DIR")
+    else None
+)
+_max_entries = int(os.environ.get("AOC_PARSE_CACHE_SIZE", DEFAULT_MAX_ENTRIES))
+_enabled = os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+
+
+def configure(
+    disk_dir: Path | str | None = None,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    enabled: bool = True,
+):
+    """Turn the cache on or off and pick where (if anywhere) pickles go"""
+    global _disk_dir, _max_entries, _enabled
+    _disk_dir = Path(disk_dir) if disk_dir is not None else None
+    _max_entries = max_entries
+    _enabled = enabled
+
+
+def max_entries() -> int:
+    return _max_entries
+
+
+def clear():
+    """Forget everything cached in memory (the disk cache is left alone)"""
+    _memory.clear()
+
+
+def _remember(key: str, value: Any):
+    _memory[key] = value
+    while len(_memory) > _max_entries:
+        _memory.popitem(last=False)
+
+
+@functools.cache
+def _source_fingerprint(module_name: str) -> bytes:
+    """Hash of a module's source, so editing a day retires its old pickles"""
+    try:
+        source = Path(sys.modules[module_name].__file__).read_bytes()
+    except (KeyError, AttributeError, TypeError, OSError):
+        return b""
+    return hashlib.sha256(source).digest()
+
+
+def input_key(func: Callable, puzzle: str | list[str]) -> str:
+    """Hash of the parser's name, its module's source and the puzzle bytes"""
+    text = puzzle if isinstance(puzzle, str) else "\n".join(puzzle)
+    digest = hashlib.sha256(text.encode())
+    digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+    digest.update(_source_fingerprint(func.__module__) or func.__code__.co_code)
+    return digest.hexdigest()
+
+
+def _disk_path(key: str) -> Path:
+    return _disk_dir / f"{key}.pickle"
+
+
+def _load_from_disk(key: str) -> tuple[bool, Any]:
+    path = _disk_path(key)
+    try:
+        with path.open("rb") as pickle_file:
+            value = pickle.load(pickle_file)
+    except Exception:
+        # truncated, or pickled from classes that have changed shape since
+        # (say, different __slots__); either way, parse it again
+        return False, None
+    # bump the mtime so eviction treats this as recently used (unless another
+    # process has evicted it since; touch() would recreate it empty)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+    return True, value
+
+
+def _save_to_disk(key: str, value: Any):
+    _disk_dir.mkdir(parents=True, exist_ok=True)
+    path = _disk_path(key)
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        # some parsers hand back things like generators (or trees too deep to
+        # pickle); memory will have to do
+        return
+    # benchmark workers can be saving the same key at once, so each one writes
+    # its own temp file and the rename decides who wins
+    with tempfile.NamedTemporaryFile(
+        dir=_disk_dir, prefix=f"{key}.", suffix=".tmp", delete=False
+    ) as temp_file:
+        temp_file.write(data)
+    temp_path = Path(temp_file.name)
+    try:
+        temp_path.replace(path)
+    except FileNotFoundError:
+        # the cache directory was cleared out from under us
+        temp_path.unlink(missing_ok=True)
+        return
+    evict()
+
+
+def evict():
+    """Drop the least recently used pickles beyond `max_entries`"""
+    if _disk_dir is None or not _disk_dir.exists():
+        return
+    last_used = []
+    for path in _disk_dir.glob("*.pickle"):
+        try:
+            last_used.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            # another process just evicted it
+            continue
+    last_used.sort()
+    for _, path in last_used[: max(len(last_used) - _max_entries, 0)]:
+        path.unlink(missing_ok=True)
+
+
+def cached(func: Callable[..., T]) -> Callable[..., T]:
+    """Decorate a `parse_input(puzzle)` so repeat calls on the same text are free"""
+
+    @functools.wraps(func)
+    def wrapper(puzzle, *args, **kwargs) -> T:
+        if not _enabled or args or kwargs or not isinstance(puzzle, str | list):
+            return func(puzzle, *args, **kwargs)
+        key = input_key(func, puzzle)
+        try:
+            value = _memory[key]
+        except KeyError:
+            pass
+        else:
+            _memory.move_to_end(key)
+            return value
+        if _disk_dir is not None:
+            found, value = _load_from_disk(key)
+            if found:
+                _remember(key, value)
+                return value
+        value = func(puzzle)
+        _remember(key, value)
+        if _disk_dir is not None:
+            _save_to_disk(key, value)
+        return value
+
+    return wrapper
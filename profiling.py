@@ -0,0 +1,155 @@
+"""Profiling hooks: cProfile, tracemalloc snapshots and search counters
+
+Wrap anything in `profiled` to get a report written next to `report_stem`:
+
+    with profiling.profiled(["cprofile", "counters"], Path("profiles/day16")):
+        day16.part_two(puzzle)
+
+- "cprofile" writes `<stem>.prof` (for snakeviz and friends) and
+  `<stem>.cprofile.txt`, the 40 most expensive calls by cumulative time
+- "tracemalloc" writes `<stem>.tracemalloc.txt`, the peak and the lines
+  holding the most memory when the block finished
+- "counters" writes `<stem>.counters.json` with whatever the search loops
+  counted while the block ran
+
+The search loops count the same way they report progress, with one falsy check
+per event when nobody's asking:
+
+    stats = profiling.counters("day19.best_score_for_blueprint")
+    while queue:
+        ...
+        if stats:
+            stats.expanded += 1
+            stats.saw_queue(len(queue))
+    if stats:
+        stats.note(counter=counter)
+
+Counters are on inside `profiled(["counters"], ...)`, or everywhere when
+AOC_COUNTERS is set.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+MODES = ("cprofile", "tracemalloc", "counters")
+
+_enabled = bool(os.environ.get("AOC_COUNTERS"))
+_collected: list["Counters"] = []
+
+
+class Counters:
+    """What one run of one search loop got up to"""
+
+    __slots__ = (
+        "name",
+        "expanded",
+        "pruned",
+        "cache_hits",
+        "queue_high_water",
+        "extra",
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self.expanded = 0
+        self.pruned = 0
+        self.cache_hits = 0
+        self.queue_high_water = 0
+        # the loop's own counters (turns, iterations, ...) by name
+        self.extra: dict[str, int] = {}
+
+    def saw_queue(self, length: int):
+        if length > self.queue_high_water:
+            self.queue_high_water = length
+
+    def note(self, **values: int):
+        """Keep the loop's ad-hoc counters alongside the standard ones"""
+        self.extra.update(values)
+
+    def as_dict(self) -> dict[str, str | int]:
+        return {
+            "name": self.name,
+            "expanded": self.expanded,
+            "pruned": self.pruned,
+            "cache_hits": self.cache_hits,
+            "queue_high_water": self.queue_high_water,
+            **self.extra,
+        }
+
+
+def configure(enabled: bool):
+    global _enabled
+    _enabled = enabled
+
+
+def counters(name: str) -> Counters | None:
+    """A fresh set of counters for one run of a loop, or None if nobody's asking"""
+    if not _enabled:
+        return None
+    stats = Counters(name)
+    _collected.append(stats)
+    return stats
+
+
+def collect() -> list[dict[str, str | int]]:
+    """Everything counted since the last collect, oldest first"""
+    results = [stats.as_dict() for stats in _collected]
+    _collected.clear()
+    return results
+
+
+def _write_cprofile(profiler: cProfile.Profile, report_stem: Path):
+    profiler.dump_stats(report_stem.with_suffix(".prof"))
+    text = io.StringIO()
+    pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(40)
+    report_stem.with_suffix(".cprofile.txt").write_text(text.getvalue())
+
+
+def _write_tracemalloc(snapshot: tracemalloc.Snapshot, peak: int, report_stem: Path):
+    lines = [f"peak: {peak} bytes", ""]
+    lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:30])
+    report_stem.with_suffix(".tracemalloc.txt").write_text("\n".join(lines) + "\n")
+
+
+@contextlib.contextmanager
+def profiled(modes: Iterable[str], report_stem: Path) -> Iterator[None]:
+    """Run the block under each of `modes` and write a report for each"""
+    modes = set(modes)
+    if unknown := modes - set(MODES):
+        raise ValueError(f"unknown profiling modes: {sorted(unknown)}")
+    report_stem.parent.mkdir(parents=True, exist_ok=True)
+    was_enabled = _enabled
+    if "counters" in modes:
+        configure(enabled=True)
+        _collected.clear()
+    if "tracemalloc" in modes:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if "cprofile" in modes else None
+    try:
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+    finally:
+        if "tracemalloc" in modes:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _write_tracemalloc(snapshot, peak, report_stem)
+        if profiler:
+            _write_cprofile(profiler, report_stem)
+        if "counters" in modes:
+            configure(enabled=was_enabled)
+            report_stem.with_suffix(".counters.json").write_text(
+                json.dumps(collect(), indent=2)
+            )
@@ -0,0 +1,66 @@
+"""Throttled progress lines for the long-running search loops
+
+Hot loops grab a reporter once and guard each update with a truthiness check:
+
+    report = progress.reporter()
+    while queue:
+        ...
+        if report:
+            report(turns=turns, queue=len(queue))
+    if report:
+        report.done()
+
+When progress is off, `reporter()` hands back None, so the loop pays for one
+falsy check per iteration and nothing else. When it's on, updates are
+rewritten in place on stderr at most once every `interval` seconds, no matter
+how often the loop calls in.
+
+Progress is on when stderr is a terminal, unless AOC_QUIET is set.
+"""
+
+import os
+import sys
+import time
+from typing import Any, TextIO
+
+DEFAULT_INTERVAL = 0.5
+
+_enabled = sys.stderr.isatty() and not os.environ.get("AOC_QUIET")
+
+
+def configure(enabled: bool):
+    global _enabled
+    _enabled = enabled
+
+
+class Progress:
+    __slots__ = ("interval", "stream", "_next_update", "_width")
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, stream: TextIO = None):
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        # don't bother printing anything for loops that finish quickly
+        self._next_update = time.monotonic() + interval
+        self._width = 0
+
+    def __call__(self, **values: Any):
+        now = time.monotonic()
+        if now < self._next_update:
+            return
+        self._next_update = now + self.interval
+        line = "  ".join(f"{name}={value}" for name, value in values.items())
+        # pad out to the last line's width so nothing is left over from it
+        self.stream.write(f"\r{line.ljust(self._width)}")
+        self.stream.flush()
+        self._width = len(line)
+
+    def done(self):
+        """Move off the progress line so the next print starts clean"""
+        if self._width:
+            self.stream.write("\n")
+            self.stream.flush()
+            self._width = 0
+
+
+def reporter(interval: float = DEFAULT_INTERVAL) -> Progress | None:
+    return Progress(interval) if _enabled else None